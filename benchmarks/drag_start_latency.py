@@ -0,0 +1,122 @@
+# coding:utf-8
+"""
+Drag start latency benchmark of LinuxMoveResize against Xvfb.
+
+A virtual X server is started, and the time spent in `startSystemMove` and
+`starSystemResize` is measured for the first call, which opens the shared
+connection and interns the atoms, and for the following calls. The result
+is reported as json. The benchmark is skipped if Xvfb is not installed.
+
+Usage:
+    python benchmarks/drag_start_latency.py
+    python benchmarks/drag_start_latency.py --calls 2000 -o result.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def summarize(times):
+    """ return the statistics of times in microseconds """
+    times = sorted(times)
+    return {
+        "median_us": round(statistics.median(times) * 1e6, 2),
+        "p99_us": round(times[int(len(times) * 0.99) - 1] * 1e6, 2),
+    }
+
+
+def runWorker(callCount):
+    """ benchmark the move resize backend on the display of current process """
+    sys.path.insert(0, ROOT)
+    from PyQt5.QtCore import QPoint, Qt
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+
+    from qframelesswindow import FramelessWindow
+    from qframelesswindow.utils import _getMoveResize
+
+    window = FramelessWindow()
+    window.resize(600, 400)
+    window.show()
+    app.processEvents()
+
+    moveResize = _getMoveResize()
+    pos = window.mapToGlobal(QPoint(100, 10))
+
+    t0 = time.perf_counter()
+    moveResize.startSystemMove(window, pos)
+    result = {"backend": moveResize.__name__, "first_call_us": round((time.perf_counter() - t0) * 1e6, 2)}
+
+    moves = []
+    resizes = []
+    for _ in range(callCount):
+        t0 = time.perf_counter()
+        moveResize.startSystemMove(window, pos)
+        moves.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        moveResize.starSystemResize(window, pos, Qt.BottomEdge | Qt.RightEdge)
+        resizes.append(time.perf_counter() - t0)
+
+    result["move"] = summarize(moves)
+    result["resize"] = summarize(resizes)
+    print(json.dumps(result))
+
+
+def startXvfb():
+    """ start Xvfb on a free display, return the process and display name """
+    readFd, writeFd = os.pipe()
+    process = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(writeFd), "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+        pass_fds=(writeFd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(writeFd)
+
+    with os.fdopen(readFd) as f:
+        display = f.readline().strip()
+
+    return process, f":{display}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000, help="number of move and resize calls")
+    parser.add_argument("-o", "--output", help="write the json result to file")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        return runWorker(args.calls)
+
+    if shutil.which("Xvfb") is None:
+        print(json.dumps({"skipped": "Xvfb is not installed"}))
+        return
+
+    process, display = startXvfb()
+    try:
+        env = dict(os.environ, DISPLAY=display, QT_QPA_PLATFORM="xcb")
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+        cmd = [sys.executable, __file__, "--worker", "--calls", str(args.calls)]
+        output = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+    finally:
+        process.terminate()
+        process.wait()
+
+    text = json.dumps(result, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
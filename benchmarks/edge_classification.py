@@ -0,0 +1,75 @@
+# coding:utf-8
+"""
+Measure the edge classification of LinuxFramelessWindow.
+
+Sends 10k synthetic mouse move events which sweep across the window border
+and reports the time, the python memory allocated and the number of cursor
+changes, each cursor change is a ChangeWindowAttributes request on X11.
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/edge_classification.py
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import QEvent, QPoint, Qt
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QApplication
+
+from qframelesswindow import FramelessWindow
+
+
+class Window(FramelessWindow):
+
+    cursorChanges = 0
+
+    def setCursor(self, cursor):
+        self.cursorChanges += 1
+        super().setCursor(cursor)
+
+
+def createEvents(window, count):
+    """ create mouse move events sweeping from the left border to the center """
+    events = []
+    y = window.y() + window.height() // 2
+    for i in range(count):
+        x = window.x() + (i % 20)
+        pos = QPoint(x, y)
+        events.append(QMouseEvent(QEvent.MouseMove, pos, pos, Qt.NoButton, Qt.NoButton, Qt.NoModifier))
+
+    return events
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = Window()
+    window.move(100, 100)
+    window.show()
+    app.processEvents()
+
+    count = 10000
+    events = createEvents(window, count)
+    window.cursorChanges = 0
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for e in events:
+        app.sendEvent(window, e)
+
+    cost = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "moves": count,
+        "seconds": round(cost, 4),
+        "retained_bytes": current,
+        "peak_bytes": peak,
+        "cursor_changes": window.cursorChanges,
+    }
+    print(json.dumps(result, indent=4))
@@ -0,0 +1,52 @@
+# coding:utf-8
+"""
+Measure the cost of the application-wide event filter of frameless windows.
+
+The time spent per mouse move event should stay flat as the number of
+frameless windows grows.
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/event_filter.py
+"""
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import QEvent, QPoint, Qt
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QApplication, QLabel
+
+from qframelesswindow import FramelessWindow
+
+
+def measure(app, windowCount, eventCount=10000):
+    """ return the average cost of a mouse move event in microseconds """
+    windows = [FramelessWindow() for _ in range(windowCount)]
+    for window in windows:
+        window.show()
+
+    label = QLabel(windows[0])
+    event = QMouseEvent(QEvent.MouseMove, QPoint(100, 100), Qt.NoButton, Qt.NoButton, Qt.NoModifier)
+    app.processEvents()
+
+    t0 = time.perf_counter()
+    for _ in range(eventCount):
+        app.sendEvent(label, event)
+
+    cost = (time.perf_counter() - t0) / eventCount * 1e6
+
+    for window in windows:
+        window.close()
+        window.deleteLater()
+
+    app.processEvents()
+    return cost
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    result = {n: round(measure(app, n), 3) for n in (1, 10, 50, 100, 200)}
+    print(json.dumps({"us_per_mouse_move": result}, indent=4))
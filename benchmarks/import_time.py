@@ -0,0 +1,82 @@
+# coding:utf-8
+"""
+Import time benchmark of qframelesswindow.
+
+Every statement is executed in a fresh interpreter with `-X importtime`, the
+total import time of the statement and the heavy modules it loads are
+reported as json.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 10 -o result.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+STATEMENTS = [
+    "import qframelesswindow",
+    "from qframelesswindow import TitleBarButton",
+    "from qframelesswindow import StandardTitleBar",
+    "from qframelesswindow import FramelessWindow",
+]
+HEAVY_MODULES = ["PyQt5.QtSvg", "PyQt5.QtXml", "PyQt5.QtX11Extras", "xcffib", "qframelesswindow._rc.resource"]
+
+
+def measure(statement):
+    """ return the total import time of statement in microseconds and the loaded heavy modules """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    cmd = [sys.executable, "-X", "importtime", "-c", statement]
+    stderr = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True).stderr
+
+    total = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line[12:]:
+            continue
+
+        _, cumulative, name = line[12:].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+
+        # the nested imports are indented and already counted by their parents
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+
+    return total, [m for m in HEAVY_MODULES if m in modules]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of runs per statement")
+    parser.add_argument("-o", "--output", help="write the json result to file")
+    args = parser.parse_args()
+
+    result = {}
+    for statement in STATEMENTS:
+        times = []
+        for _ in range(args.repeat):
+            us, heavyModules = measure(statement)
+            times.append(us)
+
+        result[statement] = {
+            "median_ms": round(statistics.median(times) / 1000, 2),
+            "heavy_modules": heavyModules,
+        }
+
+    text = json.dumps(result, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
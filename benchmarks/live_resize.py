@@ -0,0 +1,120 @@
+# coding:utf-8
+"""
+Frame time benchmark of interactive resizing on the offscreen platform.
+
+A frameless window hosts a widget whose relayout takes `--layout-cost`
+milliseconds, and a live resize started by `starSystemResize` grows the
+window step by step. Each step resizes the window and processes the
+pending events and timers of one frame. The frames per second, the median
+and p99 work time per step and the number of relayouts of the slow widget
+are reported as json for the default mode, the stretched snapshot mode and
+the padded snapshot mode.
+
+Usage:
+    python benchmarks/live_resize.py
+    python benchmarks/live_resize.py --steps 120 --layout-cost 80 -o result.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+FRAME_INTERVAL = 0.016
+MODES = {
+    "layout": None,
+    "snapshot_stretched": True,
+    "snapshot_padded": False,
+}
+
+
+def benchmarkMode(app, isStretched, steps, layoutCost):
+    """ return the frame statistics of a live resize """
+    from PyQt5.QtCore import QPoint, Qt
+    from PyQt5.QtWidgets import QVBoxLayout, QWidget
+
+    from qframelesswindow import FramelessWindow
+    from qframelesswindow.utils import starSystemResize
+
+    class SlowWidget(QWidget):
+
+        relayouts = 0
+
+        def resizeEvent(self, e):
+            super().resizeEvent(e)
+            SlowWidget.relayouts += 1
+            time.sleep(layoutCost / 1000)
+
+    window = FramelessWindow()
+    layout = QVBoxLayout(window)
+    layout.setContentsMargins(0, 32, 0, 0)
+    layout.addWidget(SlowWidget())
+    window.setSnapshotResizeEnabled(isStretched is not None, bool(isStretched))
+    window.resize(600, 400)
+    window.show()
+    app.processEvents()
+
+    SlowWidget.relayouts = 0
+    starSystemResize(window, QPoint(), Qt.RightEdge | Qt.BottomEdge)
+
+    times = []
+    start = time.perf_counter()
+    for i in range(steps):
+        t0 = time.perf_counter()
+        window.resize(600 + i*4, 400 + i*3)
+        app.processEvents()
+        t1 = time.perf_counter()
+
+        # wait for the next frame, so that the frame timer of live resize is due
+        time.sleep(max(0, FRAME_INTERVAL - (t1 - t0)))
+        t2 = time.perf_counter()
+        app.processEvents()
+        times.append(t1 - t0 + time.perf_counter() - t2)
+
+    elapsed = time.perf_counter() - start
+
+    duringResize = SlowWidget.relayouts
+    t0 = time.perf_counter()
+    window._liveResize.finish()
+    app.processEvents()
+    finishTime = time.perf_counter() - t0
+
+    window.close()
+
+    times.sort()
+    return {
+        "frames_per_second": round(steps / elapsed, 1),
+        "median_ms": round(statistics.median(times) * 1e3, 2),
+        "p99_ms": round(times[int(len(times) * 0.99) - 1] * 1e3, 2),
+        "relayouts_during_resize": duringResize,
+        "finish_ms": round(finishTime * 1e3, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=60, help="number of resize steps")
+    parser.add_argument("--layout-cost", type=float, default=50, help="relayout time of slow widget in milliseconds")
+    parser.add_argument("-o", "--output", help="write the json result to file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, ROOT)
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    result = {name: benchmarkMode(app, isStretched, args.steps, args.layout_cost)
+              for name, isStretched in MODES.items()}
+
+    text = json.dumps(result, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
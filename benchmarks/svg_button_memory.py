@@ -0,0 +1,63 @@
+# coding:utf-8
+"""
+Measure the memory and construction time of SvgTitleBarButton.
+
+The buttons share one parsed svg document, the "private icon" mode makes
+every button own a copy of document, which is what the button did before
+the icon was shared.
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/svg_button_memory.py
+"""
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from qframelesswindow.titlebar import CloseButton
+
+
+def residentMemory():
+    """ return the resident memory of process in bytes """
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def measure(count, isPrivate):
+    """ return the memory in bytes and construction time in microseconds of a button """
+    parent = QWidget()
+    memory = residentMemory()
+
+    t0 = time.perf_counter()
+    for _ in range(count):
+        button = CloseButton(parent)
+        if isPrivate:
+            button._svgDom
+
+    cost = (time.perf_counter() - t0) / count * 1e6
+    memory = (residentMemory() - memory) / count
+
+    parent.deleteLater()
+    return round(memory), round(cost, 2)
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    CloseButton()
+
+    count = 2000
+    sharedMemory, sharedTime = measure(count, False)
+    privateMemory, privateTime = measure(count, True)
+
+    result = {
+        "buttons": count,
+        "bytes_per_button_private_icon": privateMemory,
+        "bytes_per_button_shared_icon": sharedMemory,
+        "us_per_button_private_icon": privateTime,
+        "us_per_button_shared_icon": sharedTime,
+    }
+    print(json.dumps(result, indent=4))
@@ -0,0 +1,55 @@
+# coding:utf-8
+"""
+Compare the paint cost of SvgTitleBarButton with and without the icon cache.
+
+Disabling the cache makes every paint parse and render the svg again,
+which is what the button did before the cache was introduced.
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/svg_button_paint.py
+"""
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtWidgets import QApplication
+
+from qframelesswindow.titlebar import CloseButton
+from qframelesswindow.titlebar.icon_cache import iconCache
+from qframelesswindow.titlebar.title_bar_buttons import TitleBarButtonState
+
+
+def measure(button, paintCount=3000):
+    """ return the average paint time in microseconds """
+    states = list(TitleBarButtonState)
+    t0 = time.perf_counter()
+    for i in range(paintCount):
+        button.setState(states[i % len(states)])
+        button.repaint()
+
+    return (time.perf_counter() - t0) / paintCount * 1e6
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    button = CloseButton()
+    button.show()
+    app.processEvents()
+
+    limit = iconCache.cacheLimit()
+    iconCache.setCacheLimit(0)
+    before = measure(button)
+
+    iconCache.setCacheLimit(limit)
+    after = measure(button)
+
+    result = {
+        "us_per_paint_without_cache": round(before, 2),
+        "us_per_paint_with_cache": round(after, 2),
+        "speedup": round(before / after, 2),
+        "cache_cost_bytes": iconCache.cost(),
+    }
+    print(json.dumps(result, indent=4))
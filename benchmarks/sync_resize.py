@@ -0,0 +1,215 @@
+# coding:utf-8
+"""
+Configure-to-paint latency benchmark of interactive resizing on Xvfb.
+
+A frameless window with a slow paint event runs on a virtual X server. A
+stand-in window manager advertises `_NET_WM_SYNC_REQUEST` on the root window
+before the application starts, since Qt only creates the sync counter if the
+window manager supports the protocol, and then resizes the window step by
+step through the protocol: it sends a sync request, configures the
+window and waits until the sync counter of window reaches the requested
+value, which happens after the window has painted the new size. Whether
+the window advertises the protocol and the latency of each step are
+reported as json. The benchmark is skipped if Xvfb is not installed.
+
+Usage:
+    python benchmarks/sync_resize.py
+    python benchmarks/sync_resize.py --steps 200 --paint-cost 8 -o result.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+TIMEOUT = 2
+
+
+def runApp(paintCost):
+    """ show a frameless window whose paint event takes `paintCost` milliseconds """
+    sys.path.insert(0, ROOT)
+    from PyQt5.QtWidgets import QApplication
+
+    from qframelesswindow import FramelessWindow
+
+    class Window(FramelessWindow):
+
+        def paintEvent(self, e):
+            super().paintEvent(e)
+            time.sleep(paintCost / 1000)
+
+    app = QApplication(sys.argv)
+    window = Window()
+    window.resize(400, 300)
+    window.show()
+    app.processEvents()
+
+    isSupported = window.windowEffect.isSyncRequestSupported(window.winId())
+    print(json.dumps({"window": int(window.winId()), "supported": isSupported}), flush=True)
+    app.exec_()
+
+
+def summarize(times):
+    """ return the statistics of times in milliseconds """
+    times = sorted(times)
+    return {
+        "median_ms": round(statistics.median(times) * 1e3, 2),
+        "p99_ms": round(times[int(len(times) * 0.99) - 1] * 1e3, 2),
+        "max_ms": round(times[-1] * 1e3, 2),
+    }
+
+
+def internAtoms(conn, names):
+    """ intern the atoms with pipelined requests """
+    cookies = [conn.core.InternAtom(False, len(i), i) for i in names]
+    return [i.reply().atom for i in cookies]
+
+
+def startWindowManager(display):
+    """ advertise the sync request protocol like an EWMH window manager, return the connection
+
+    Qt only creates the sync counter of window if `_NET_SUPPORTED` of root window
+    contains `_NET_WM_SYNC_REQUEST` when the application starts, so the connection
+    must be kept open until the benchmark finishes.
+    """
+    import struct
+
+    import xcffib
+    from xcffib.xproto import Atom, PropMode, WindowClass
+
+    conn = xcffib.connect(display=display)
+    xproto = conn.core
+    root = conn.get_setup().roots[0].root
+
+    supported, supportingWmCheck, syncRequest, counter = internAtoms(conn, [
+        "_NET_SUPPORTED", "_NET_SUPPORTING_WM_CHECK",
+        "_NET_WM_SYNC_REQUEST", "_NET_WM_SYNC_REQUEST_COUNTER"])
+
+    # the supporting window check is a child of root which refers to itself
+    checkWindow = conn.generate_id()
+    xproto.CreateWindow(0, checkWindow, root, -1, -1, 1, 1, 0, WindowClass.InputOnly, 0, 0, [])
+    for window in (root, checkWindow):
+        xproto.ChangeProperty(PropMode.Replace, window, supportingWmCheck, Atom.WINDOW, 32, 1,
+                              struct.pack("=I", checkWindow))
+
+    xproto.ChangeProperty(PropMode.Replace, root, supported, Atom.ATOM, 32, 2,
+                          struct.pack("=2I", syncRequest, counter))
+    conn.flush()
+    return conn
+
+
+def runWindowManager(conn, window, steps):
+    """ resize the window through the sync request protocol, return the latency of each step """
+    import struct
+
+    import xcffib.sync
+    from xcffib.xproto import Atom, ConfigWindow, EventMask
+
+    xproto = conn.core
+    sync = conn(xcffib.sync.key)
+    sync.Initialize(3, 1).reply()
+
+    protocols, syncRequest, counterAtom = internAtoms(
+        conn, ["WM_PROTOCOLS", "_NET_WM_SYNC_REQUEST", "_NET_WM_SYNC_REQUEST_COUNTER"])
+
+    reply = xproto.GetProperty(False, window, counterAtom, Atom.CARDINAL, 0, 1).reply()
+    if not reply.value_len:
+        return None
+
+    counter = reply.value.to_atoms()[0]
+    value = 0
+    times = []
+    for i in range(steps):
+        value += 1
+        data = struct.pack("=5I", syncRequest, 0, value & 0xFFFFFFFF, value >> 32, 0)
+        event = struct.pack("=BBHII", 33, 32, 0, window, protocols) + data
+
+        t0 = time.perf_counter()
+        xproto.SendEvent(False, window, EventMask.NoEvent, event)
+        width, height = 400 + i % 200, 300 + i % 100
+        xproto.ConfigureWindow(window, ConfigWindow.Width | ConfigWindow.Height, [width, height])
+        conn.flush()
+
+        while True:
+            result = sync.QueryCounter(counter).reply().counter_value
+            if (result.hi << 32 | result.lo) >= value:
+                times.append(time.perf_counter() - t0)
+                break
+
+            if time.perf_counter() - t0 > TIMEOUT:
+                raise RuntimeError(f"the sync counter is not updated at step {i}")
+
+            time.sleep(0.0002)
+
+    return times
+
+
+def startXvfb():
+    """ start Xvfb on a free display, return the process and display name """
+    readFd, writeFd = os.pipe()
+    process = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(writeFd), "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+        pass_fds=(writeFd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(writeFd)
+
+    with os.fdopen(readFd) as f:
+        display = f.readline().strip()
+
+    return process, f":{display}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=100, help="number of resize steps")
+    parser.add_argument("--paint-cost", type=float, default=4, help="duration of each paint in milliseconds")
+    parser.add_argument("-o", "--output", help="write the json result to file")
+    parser.add_argument("--app", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.app:
+        return runApp(args.paint_cost)
+
+    if shutil.which("Xvfb") is None:
+        print(json.dumps({"skipped": "Xvfb is not installed"}))
+        return
+
+    xvfb, display = startXvfb()
+    app = None
+    wm = None
+    try:
+        wm = startWindowManager(display)
+        env = dict(os.environ, DISPLAY=display, QT_QPA_PLATFORM="xcb")
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+        cmd = [sys.executable, __file__, "--app", "--paint-cost", str(args.paint_cost)]
+        app = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, text=True)
+        info = json.loads(app.stdout.readline())
+
+        result = {"sync_request_supported": info["supported"], "paint_cost_ms": args.paint_cost}
+        times = runWindowManager(wm, info["window"], args.steps)
+        if times:
+            result["configure_to_paint"] = summarize(times)
+    finally:
+        if app:
+            app.terminate()
+            app.wait()
+
+        if wm:
+            wm.disconnect()
+
+        xvfb.terminate()
+        xvfb.wait()
+
+    text = json.dumps(result, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
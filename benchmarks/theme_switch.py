@@ -0,0 +1,69 @@
+# coding:utf-8
+"""
+Measure the latency of switching the theme of title bar buttons.
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/theme_switch.py
+"""
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import QEvent, QObject, Qt
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QApplication
+
+from qframelesswindow import FramelessWindow
+from qframelesswindow.titlebar import CloseButton, TitleBarButton, TitleBarButtonStyle
+
+
+class PaintCounter(QObject):
+    """ Count the paint events of title bar buttons """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.count = 0
+
+    def eventFilter(self, obj, e):
+        if e.type() == QEvent.Paint and isinstance(obj, TitleBarButton):
+            self.count += 1
+
+        return False
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    windowCount = 500
+    windows = [FramelessWindow() for _ in range(windowCount)]
+    for window in windows:
+        window.show()
+
+    app.processEvents()
+    counter = PaintCounter(app)
+    app.installEventFilter(counter)
+
+    darkStyle = TitleBarButtonStyle(
+        normalColor=Qt.white,
+        hoverColor=Qt.white,
+        pressedColor=Qt.white,
+        hoverBackgroundColor=QColor(255, 255, 255, 26),
+        pressedBackgroundColor=QColor(255, 255, 255, 51)
+    )
+    darkCloseStyle = CloseButton.defaultStyle.replace(normalColor=Qt.white)
+
+    t0 = time.perf_counter()
+    TitleBarButton.setThemeStyles({TitleBarButton: darkStyle, CloseButton: darkCloseStyle})
+    t1 = time.perf_counter()
+    app.processEvents()
+    t2 = time.perf_counter()
+
+    result = {
+        "windows": windowCount,
+        "switch_ms": round((t1 - t0) * 1e3, 2),
+        "repaint_ms": round((t2 - t1) * 1e3, 2),
+        "paints_per_button": counter.count / (windowCount * 3),
+    }
+    print(json.dumps(result, indent=4))
@@ -0,0 +1,124 @@
+# coding:utf-8
+"""
+Paint benchmark of title bar buttons on the offscreen platform.
+
+The buttons of `TitleBar`, `StandardTitleBar` and optional custom title bars
+are driven through the NORMAL/HOVER/PRESSED states and repainted at several
+device pixel ratios. The paints per second, the median and p99 paint time
+and the python allocations of each button class are reported as json.
+
+Usage:
+    python benchmarks/title_bar_paint.py
+    python benchmarks/title_bar_paint.py --title-bar mypackage.widgets:MyTitleBar -o result.json
+"""
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+DEVICE_PIXEL_RATIOS = (1.0, 1.25, 1.5, 2.0)
+
+
+def loadClass(path):
+    """ load class from `module:ClassName` """
+    module, name = path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def benchmarkButton(button, paintCount):
+    """ return the paint statistics of a button """
+    from qframelesswindow.titlebar.title_bar_buttons import TitleBarButtonState
+
+    states = list(TitleBarButtonState)
+    times = []
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    blocks = sum(s.count for s in tracemalloc.take_snapshot().statistics("filename"))
+
+    for i in range(paintCount):
+        button.setState(states[i % len(states)])
+        t0 = time.perf_counter()
+        button.repaint()
+        times.append(time.perf_counter() - t0)
+
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    times.sort()
+    return {
+        "paints_per_second": round(len(times) / sum(times)),
+        "median_us": round(statistics.median(times) * 1e6, 2),
+        "p99_us": round(times[int(len(times) * 0.99) - 1] * 1e6, 2),
+        "device_pixel_ratio": button.devicePixelRatioF(),
+        "retained_blocks": sum(s.count for s in snapshot.statistics("filename")) - blocks,
+        "peak_bytes": peak,
+    }
+
+
+def runWorker(titleBarPaths, paintCount):
+    """ benchmark the title bars at the device pixel ratio of current process """
+    sys.path.insert(0, ROOT)
+    from PyQt5.QtWidgets import QApplication, QWidget
+
+    app = QApplication(sys.argv)
+    result = {}
+    for path in titleBarPaths:
+        window = QWidget()
+        titleBar = loadClass(path)(window)
+        window.resize(600, 400)
+        titleBar.resize(600, titleBar.height())
+        window.show()
+        app.processEvents()
+
+        from qframelesswindow.titlebar import TitleBarButton
+        for button in titleBar.findChildren(TitleBarButton):
+            name = f"{path.split(':')[1]}.{type(button).__name__}"
+            result[name] = benchmarkButton(button, paintCount)
+
+        window.close()
+
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--title-bar", action="append", default=[],
+                        help="extra title bar class to benchmark, in the form of module:ClassName")
+    parser.add_argument("--paints", type=int, default=3000, help="number of paints per button")
+    parser.add_argument("-o", "--output", help="write the json result to file")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    titleBars = ["qframelesswindow:TitleBar", "qframelesswindow:StandardTitleBar"] + args.title_bar
+    if args.worker:
+        return runWorker(titleBars, args.paints)
+
+    result = {}
+    for dpr in DEVICE_PIXEL_RATIOS:
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen", QT_SCALE_FACTOR=str(dpr))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, os.getcwd(), env.get("PYTHONPATH")]))
+        cmd = [sys.executable, __file__, "--worker", "--paints", str(args.paints)]
+        for titleBar in args.title_bar:
+            cmd += ["--title-bar", titleBar]
+
+        output = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True).stdout
+        result[str(dpr)] = json.loads(output.strip().splitlines()[-1])
+
+    text = json.dumps(result, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,40 +15,34 @@ Examples are available at https://github.com/zhiyiYo/PyQt-Frameless-Window/tree/
 __version__ = "0.3.9"
 __author__ = "zhiyiYo"
 
-import sys
+from importlib import import_module
 
-from PyQt5.QtWidgets import QDialog, QMainWindow
+# the platform backends, QtSvg and QtXml are only imported when they are used
+_LAZY_ATTRIBUTES = {
+    "TitleBar": ".titlebar",
+    "TitleBarButton": ".titlebar",
+    "TitleBarButtonStyle": ".titlebar",
+    "SvgTitleBarButton": ".titlebar",
+    "StandardTitleBar": ".titlebar",
+    "TitleBarBase": ".titlebar",
+    "FramelessWindow": ".frameless_window",
+    "AcrylicWindow": ".frameless_window",
+    "WindowEffect": ".frameless_window",
+    "FramelessDialog": ".frameless_window",
+    "FramelessMainWindow": ".frameless_window",
+}
 
-from .titlebar import TitleBar, TitleBarButton, SvgTitleBarButton, StandardTitleBar, TitleBarBase
+__all__ = list(_LAZY_ATTRIBUTES)
 
-if sys.platform == "win32":
-    from .windows import AcrylicWindow
-    from .windows import WindowsFramelessWindow as FramelessWindow
-    from .windows import WindowsWindowEffect as WindowEffect
-elif sys.platform == "darwin":
-    from .mac import AcrylicWindow
-    from .mac import MacFramelessWindow as FramelessWindow
-    from .mac import MacWindowEffect as WindowEffect
-else:
-    from .linux import LinuxFramelessWindow as FramelessWindow
-    from .linux import LinuxWindowEffect as WindowEffect
 
-    AcrylicWindow = FramelessWindow
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
 
-class FramelessDialog(QDialog, FramelessWindow):
-    """ Frameless dialog """
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.titleBar.minBtn.hide()
-        self.titleBar.maxBtn.hide()
-        self.titleBar.setDoubleClickEnabled(False)
-        self.windowEffect.disableMaximizeButton(self.winId())
-
-
-class FramelessMainWindow(QMainWindow, FramelessWindow):
-    """ Frameless main window """
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,25 @@
+# coding:utf-8
+from threading import Lock
+
+RESOURCE_PREFIX = ":/qframelesswindow/"
+
+_lock = Lock()
+_isRegistered = False
+
+
+def registerResources():
+    """ register the built-in resources of qframelesswindow, it's safe to call it repeatedly from any thread """
+    global _isRegistered
+    if _isRegistered:
+        return
+
+    with _lock:
+        if not _isRegistered:
+            # the resource data is registered when the module is imported
+            from . import resource
+            _isRegistered = True
+
+
+def isResourcePath(path):
+    """ whether the path points to a built-in resource """
+    return path.startswith(RESOURCE_PREFIX)
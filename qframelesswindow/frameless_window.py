@@ -0,0 +1,35 @@
+# coding:utf-8
+import sys
+
+from PyQt5.QtWidgets import QDialog, QMainWindow
+
+if sys.platform == "win32":
+    from .windows import AcrylicWindow
+    from .windows import WindowsFramelessWindow as FramelessWindow
+    from .windows import WindowsWindowEffect as WindowEffect
+elif sys.platform == "darwin":
+    from .mac import AcrylicWindow
+    from .mac import MacFramelessWindow as FramelessWindow
+    from .mac import MacWindowEffect as WindowEffect
+else:
+    from .linux import AcrylicWindow
+    from .linux import LinuxFramelessWindow as FramelessWindow
+    from .linux import LinuxWindowEffect as WindowEffect
+
+
+class FramelessDialog(QDialog, FramelessWindow):
+    """ Frameless dialog """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.titleBar.minBtn.hide()
+        self.titleBar.maxBtn.hide()
+        self.titleBar.setDoubleClickEnabled(False)
+        self.windowEffect.disableMaximizeButton(self.winId())
+
+
+class FramelessMainWindow(QMainWindow, FramelessWindow):
+    """ Frameless main window """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
@@ -1,33 +1,110 @@
 # coding:utf-8
-from PyQt5.QtCore import QCoreApplication, QEvent, Qt
-from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtCore import (QEvent, QMargins, QPoint, QPointF, QRect, QRectF,
+                          QSizeF, Qt, QTimer)
+from PyQt5.QtGui import QColor, QPainter, QPixmap, QRegion, QTransform
 from PyQt5.QtWidgets import QWidget
 
 from ..titlebar import TitleBar
-from ..utils.linux_utils import LinuxMoveResize
+from ..utils import starSystemResize
+from ..utils.hit_test import (BOTTOM_EDGE, LEFT_EDGE, RIGHT_EDGE, TOP_EDGE,
+                              BorderHitTest)
+from ..utils.live_resize import LiveResizeTracker
+from .event_dispatcher import FramelessEventDispatcher
+from .rounded_corners import CornerNotches
 from .window_effect import LinuxWindowEffect
+from .window_shadow import ShadowSlices
+
+EDGE_CURSORS = {
+    LEFT_EDGE | TOP_EDGE: Qt.SizeFDiagCursor,
+    RIGHT_EDGE | BOTTOM_EDGE: Qt.SizeFDiagCursor,
+    RIGHT_EDGE | TOP_EDGE: Qt.SizeBDiagCursor,
+    LEFT_EDGE | BOTTOM_EDGE: Qt.SizeBDiagCursor,
+    TOP_EDGE: Qt.SizeVerCursor,
+    BOTTOM_EDGE: Qt.SizeVerCursor,
+    LEFT_EDGE: Qt.SizeHorCursor,
+    RIGHT_EDGE: Qt.SizeHorCursor,
+}
 
 
 class LinuxFramelessWindow(QWidget):
     """ Frameless window for Linux system """
 
     BORDER_WIDTH = 5
+    SHADOW_RADIUS = 16
+    SHADOW_COLOR = QColor(0, 0, 0, 100)
 
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.windowEffect = LinuxWindowEffect(self)
         self.titleBar = TitleBar(self)
         self._isResizeEnabled = True
+        self._cursorEdges = None
+        self._borderHitTest = BorderHitTest(self.BORDER_WIDTH)
+        self._opaqueRegion = None
+        self._isCompositorBypassed = None
+        self._compositorBypassHint = None
+
+        self._isShadowEnabled = False
+        self._isShadowTranslucent = False
+        self._shadowRadius = self.SHADOW_RADIUS
+        self._shadowColor = QColor(self.SHADOW_COLOR)
+        self._shadowMargin = 0
+        self._frameExtents = None
+        self._cornerRadius = 0
+        self._maskKey = None
+        self._liveResize = LiveResizeTracker(self, self._updateTitleBarGeometry)
 
         self.updateFrameless()
-        QCoreApplication.instance().installEventFilter(self)
+        FramelessEventDispatcher.instance().register(self)
 
         self.titleBar.raise_()
         self.resize(500, 500)
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        self.titleBar.resize(self.width(), self.titleBar.height())
+        if not self._liveResize.requestUpdate():
+            self._updateTitleBarGeometry()
+
+        self._updateMask()
+        self._updateOpaqueRegion()
+
+    def moveEvent(self, e):
+        super().moveEvent(e)
+        self._liveResize.notifyMoved()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._updateOpaqueRegion()
+        self._updateFrameExtents()
+        self._updateCompositorBypass()
+
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        if e.type() == QEvent.WindowStateChange:
+            self._updateShadowMargin()
+            self._updateCompositorBypass()
+
+    def setAttribute(self, attribute, on=True):
+        super().setAttribute(attribute, on)
+        if attribute == Qt.WA_TranslucentBackground:
+            self._updateOpaqueRegion()
+            self._updateCompositorBypass()
+
+    def setMask(self, mask):
+        super().setMask(mask)
+        self._updateOpaqueRegion()
+
+    def clearMask(self):
+        super().clearMask()
+        self._updateOpaqueRegion()
+
+    def paintEvent(self, e):
+        if not self._isShadowTranslucent:
+            return
+
+        painter = QPainter(self)
+        self._drawShadow(painter)
+        painter.fillRect(self._windowRect(), self.palette().window())
 
     def updateFrameless(self):
         self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)
@@ -45,41 +122,395 @@ class LinuxFramelessWindow(QWidget):
         self.titleBar = titleBar
         self.titleBar.setParent(self)
         self.titleBar.raise_()
+        self._updateTitleBarGeometry()
+
+    def setCompositorBypassed(self, isBypassed=None):
+        """ set whether the compositor is bypassed (X11 only)
+
+        Parameters
+        ----------
+        isBypassed: bool | None
+            `True` to always bypass the compositor, `False` to never bypass it, `None`
+            to bypass it only when the window is opaque and maximized or full screen
+        """
+        self._isCompositorBypassed = isBypassed
+        self._updateCompositorBypass()
+
+    def isCompositorBypassed(self):
+        """ get the compositor bypass mode, `None` means it's decided by the window state """
+        return self._isCompositorBypassed
+
+    def setShadowEnabled(self, isEnabled: bool):
+        """ set whether to draw the client-side shadow
+
+        The window becomes translucent when the shadow is enabled, so this
+        method should be called before the window is shown.
+        """
+        if isEnabled and not self.testAttribute(Qt.WA_TranslucentBackground):
+            self._isShadowTranslucent = True
+            self.setAttribute(Qt.WA_TranslucentBackground)
+
+        self._isShadowEnabled = isEnabled
+        self._updateShadowMargin()
+
+    def isShadowEnabled(self):
+        """ whether the client-side shadow is enabled """
+        return self._isShadowEnabled
+
+    def setShadowRadius(self, radius: int):
+        """ set the radius of client-side shadow in device independent pixels """
+        self._shadowRadius = max(1, radius)
+        self._updateShadowMargin()
+
+    def setShadowColor(self, color):
+        """ set the color of client-side shadow at the edge of window
+
+        Parameters
+        ----------
+        color: QColor | Qt.GlobalColor | str
+            shadow color
+        """
+        self._shadowColor = QColor(color)
+        self.update()
+
+    def setCornerRadius(self, radius: int):
+        """ set the radius of rounded corners in device independent pixels
+
+        The corners are cut by the window mask, which is only changed when the
+        size of window or the radius changes, and it's removed when the window
+        is maximized or full screen. The corners are square if `radius` is 0.
+        """
+        self._cornerRadius = max(0, radius)
+        self._updateMask()
+        self._updateOpaqueRegion()
+
+    def cornerRadius(self):
+        """ get the radius of rounded corners """
+        return self._cornerRadius
+
+    @property
+    def liveResizeStarted(self):
+        """ signal emitted when the window starts to be moved or resized interactively """
+        return self._liveResize.started
+
+    @property
+    def liveResizeFinished(self):
+        """ signal emitted when the interactive move or resize of window finishes """
+        return self._liveResize.finished
+
+    def isLiveResizing(self):
+        """ whether the window is moved or resized interactively """
+        return self._liveResize.isActive()
+
+    def setSnapshotResizeEnabled(self, isEnabled: bool, isStretched=True):
+        """ set whether to show a snapshot of content instead of laying it out during live resize
+
+        Parameters
+        ----------
+        isEnabled: bool
+            whether to enable snapshot resizing
+
+        isStretched: bool
+            whether to stretch the snapshot to the size of window, otherwise the
+            snapshot is padded with the window color
+        """
+        self._liveResize.setSnapshotEnabled(isEnabled, isStretched)
+
+    def isSnapshotResizeEnabled(self):
+        """ whether snapshot resizing is enabled """
+        return self._liveResize.isSnapshotEnabled()
 
     def setResizeEnabled(self, isEnabled: bool):
         """ set whether resizing is enabled """
         self._isResizeEnabled = isEnabled
 
-    def eventFilter(self, obj, event):
-        et = event.type()
-        if et != QEvent.MouseButtonPress and et != QEvent.MouseMove or not self._isResizeEnabled:
-            return False
-
-        edges = Qt.Edges()
-        pos = QMouseEvent(event).globalPos() - self.pos()
-        if pos.x() < self.BORDER_WIDTH:
-            edges |= Qt.LeftEdge
-        if pos.x() >= self.width()-self.BORDER_WIDTH:
-            edges |= Qt.RightEdge
-        if pos.y() < self.BORDER_WIDTH:
-            edges |= Qt.TopEdge
-        if pos.y() >= self.height()-self.BORDER_WIDTH:
-            edges |= Qt.BottomEdge
-
-        # change cursor
-        if et == QEvent.MouseMove and self.windowState() == Qt.WindowNoState:
-            if edges in (Qt.LeftEdge | Qt.TopEdge, Qt.RightEdge | Qt.BottomEdge):
-                self.setCursor(Qt.SizeFDiagCursor)
-            elif edges in (Qt.RightEdge | Qt.TopEdge, Qt.LeftEdge | Qt.BottomEdge):
-                self.setCursor(Qt.SizeBDiagCursor)
-            elif edges in (Qt.TopEdge, Qt.BottomEdge):
-                self.setCursor(Qt.SizeVerCursor)
-            elif edges in (Qt.LeftEdge, Qt.RightEdge):
-                self.setCursor(Qt.SizeHorCursor)
-            else:
-                self.setCursor(Qt.ArrowCursor)
-
-        elif obj in (self, self.titleBar) and et == QEvent.MouseButtonPress and edges:
-            LinuxMoveResize.starSystemResize(self, event.globalPos(), edges)
-
-        return super().eventFilter(obj, event)
+    def _handleMouseEvent(self, obj, event):
+        """ handle the mouse press or move event sent to the widgets of this window """
+        if not self._isResizeEnabled:
+            return
+
+        # read the coordinates from the delivered event without wrapping it
+        edges = self._borderHitTest.hitTest(
+            event.globalX() - self.x(),
+            event.globalY() - self.y(),
+            self.width(),
+            self.height(),
+            isMaximized=bool(self.windowState() & (Qt.WindowMaximized | Qt.WindowFullScreen))
+        )
+
+        if event.type() == QEvent.MouseMove:
+            self._updateCursor(edges)
+        elif edges and (obj is self or obj is self.titleBar):
+            starSystemResize(self, event.globalPos(), Qt.Edges(edges))
+
+    def _updateCursor(self, edges):
+        """ change the cursor only when the edges under the mouse change """
+        if edges == self._cursorEdges:
+            return
+
+        self._cursorEdges = edges
+        self.setCursor(EDGE_CURSORS.get(edges, Qt.ArrowCursor))
+
+    def _isTranslucent(self):
+        """ whether the window is translucent, the window made translucent for shadow is still opaque """
+        return self.testAttribute(Qt.WA_TranslucentBackground) and not self._isShadowTranslucent
+
+    def _windowRect(self):
+        """ get the rect of window without shadow """
+        m = self._shadowMargin
+        return self.rect().adjusted(m, m, -m, -m)
+
+    def _getOpaqueRegion(self):
+        """ get the opaque region of window in device independent pixels """
+        if self._isTranslucent():
+            return QRegion()
+
+        region = QRegion(self._windowRect())
+        mask = self.mask()
+        return region if mask.isEmpty() else region & mask
+
+    def _updateTitleBarGeometry(self):
+        m = self._shadowMargin
+        self.titleBar.setGeometry(m, m, self.width() - 2*m, self.titleBar.height())
+
+    def _drawShadow(self, painter):
+        if not self._shadowMargin:
+            return
+
+        slices = ShadowSlices.get(self._shadowRadius, self._shadowColor, self.devicePixelRatioF())
+        slices.draw(painter, self._windowRect())
+
+    def _updateShadowMargin(self):
+        """ show the shadow in the margins of window, the shadow is hidden when the window is maximized """
+        isMax = self.windowState() & (Qt.WindowMaximized | Qt.WindowFullScreen)
+        margin = self._shadowRadius if self._isShadowEnabled and not isMax else 0
+        if margin != self._shadowMargin:
+            # the users' contents margins are kept
+            d = margin - self._shadowMargin
+            self._shadowMargin = margin
+            self.setContentsMargins(self.contentsMargins() + QMargins(d, d, d, d))
+
+            width = self.BORDER_WIDTH + margin
+            self._borderHitTest.setBorderWidths(width, width, width, width)
+            self._updateTitleBarGeometry()
+            self.update()
+
+        self._updateMask()
+        self._updateFrameExtents()
+        self._updateOpaqueRegion()
+
+    def _updateMask(self):
+        """ cut the rounded corners, the mask is only set when the corner geometry changes """
+        rect = self._windowRect()
+        radius = min(self._cornerRadius, rect.width() // 2, rect.height() // 2)
+        if radius <= 0 or self.windowState() & (Qt.WindowMaximized | Qt.WindowFullScreen):
+            key = None
+        else:
+            key = (self.width(), self.height(), self._shadowMargin, radius)
+
+        if key == self._maskKey:
+            return
+
+        self._maskKey = key
+        if key is None:
+            self.clearMask()
+        else:
+            self.setMask(CornerNotches.get(radius).cut(QRegion(self.rect()), rect))
+
+    def _updateFrameExtents(self):
+        """ publish the size of shadow as `_GTK_FRAME_EXTENTS`, so the window manager snaps to the visible frame """
+        if not self.isWindow() or not self.testAttribute(Qt.WA_WState_Created):
+            return
+
+        m = round(self._shadowMargin * self.devicePixelRatioF())
+        if m == self._frameExtents:
+            return
+
+        self._frameExtents = m
+        self.windowEffect.setFrameExtents(self.winId(), QMargins(m, m, m, m))
+
+    def _updateOpaqueRegion(self):
+        """ publish the opaque region only when the shape or translucency of window changes """
+        if not self.isWindow() or not self.testAttribute(Qt.WA_WState_Created):
+            return
+
+        dpr = self.devicePixelRatioF()
+        region = QTransform.fromScale(dpr, dpr).map(self._getOpaqueRegion())
+        if region == self._opaqueRegion:
+            return
+
+        self._opaqueRegion = region
+        self.windowEffect.setOpaqueRegion(self.winId(), region)
+
+    def _updateCompositorBypass(self):
+        """ update the bypass compositor hint only when it changes """
+        if not self.isWindow() or not self.testAttribute(Qt.WA_WState_Created):
+            return
+
+        hint = self._isCompositorBypassed
+        if hint is None and self.windowState() & (Qt.WindowMaximized | Qt.WindowFullScreen) \
+                and not self._isTranslucent():
+            hint = True
+
+        if hint == self._compositorBypassHint:
+            return
+
+        self._compositorBypassHint = hint
+        self.windowEffect.setCompositorBypass(self.winId(), hint)
+
+
+class AcrylicWindow(LinuxFramelessWindow):
+    """ A frameless window with acrylic effect
+
+    The background is blurred by the compositor if it supports
+    `_KDE_NET_WM_BLUR_BEHIND_REGION`. Otherwise the window is filled with the
+    opaque acrylic color, or with a backdrop blurred in software if the
+    software acrylic is enabled.
+    """
+
+    SOFTWARE_BLUR_RADIUS = 32
+    BACKDROP_UPDATE_DELAY = 150
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._isBlurEnabled = self.windowEffect.isBlurBehindSupported()
+        if self._isBlurEnabled:
+            self.setAttribute(Qt.WA_TranslucentBackground)
+
+        self.windowEffect.setAcrylicEffect(self.winId())
+        self._blurRegion = QRegion()
+
+        self._isSoftwareAcrylicEnabled = False
+        self._downsampleFactor = 4
+        self._blurredScreen = None
+        self._backdrop = None
+        self._backdropTimer = QTimer(self)
+        self._backdropTimer.setSingleShot(True)
+        self._backdropTimer.setInterval(self.BACKDROP_UPDATE_DELAY)
+        self._backdropTimer.timeout.connect(self._updateBackdrop)
+
+    def setSoftwareAcrylicEnabled(self, isEnabled, downsampleFactor=4):
+        """ set whether to blur the backdrop in software when the compositor can't blur it
+
+        The screen is grabbed and blurred when the window is shown, and the
+        backdrop is cropped from it after the window is moved or resized, so
+        this method should be called before the window is shown. NumPy is required.
+
+        Parameters
+        ----------
+        isEnabled: bool
+            whether to enable software acrylic
+
+        downsampleFactor: int
+            the downsample factor of screen before blurring, a larger factor is faster
+            but the backdrop is coarser
+        """
+        if isEnabled:
+            import numpy  # noqa: F401
+
+        self._isSoftwareAcrylicEnabled = isEnabled and not self._isBlurEnabled
+        self._downsampleFactor = max(1, int(downsampleFactor))
+        self._blurredScreen = None
+        self._backdrop = None
+        self.update()
+
+    def isSoftwareAcrylicEnabled(self):
+        """ whether the backdrop is blurred in software """
+        return self._isSoftwareAcrylicEnabled
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._updateBlurRegion()
+        if self._isSoftwareAcrylicEnabled:
+            self._backdropTimer.start()
+
+    def moveEvent(self, e):
+        super().moveEvent(e)
+        if self._isSoftwareAcrylicEnabled:
+            self._backdropTimer.start()
+
+    def showEvent(self, e):
+        # the window is not mapped yet, so the screen doesn't contain it
+        if self._isSoftwareAcrylicEnabled:
+            self._grabScreen()
+            self._updateBackdrop()
+
+        super().showEvent(e)
+        self._updateBlurRegion()
+
+    def paintEvent(self, e):
+        painter = QPainter(self)
+        self._drawShadow(painter)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+
+        rect = self._windowRect()
+        if self._backdrop is not None:
+            dpr = self._backdrop.devicePixelRatio()
+            source = QRectF(QPointF(rect.topLeft()) * dpr, QSizeF(rect.size()) * dpr)
+            painter.drawPixmap(QRectF(rect), self._backdrop, source)
+            return
+
+        color = self.windowEffect.acrylicColor
+        if not self._isBlurEnabled:
+            color = color.toRgb()
+            color.setAlpha(255)
+
+        painter.fillRect(rect, color)
+
+    def _updateBlurRegion(self):
+        """ resend the blur region only when the shape of window changes """
+        if not self._isBlurEnabled:
+            return
+
+        # the whole window is blurred if the region is empty
+        region = QRegion()
+        mask = self.mask()
+        if not mask.isEmpty() or self._shadowMargin:
+            dpr = self.devicePixelRatioF()
+            region = QRegion(self._windowRect())
+            region = QTransform.fromScale(dpr, dpr).map(region if mask.isEmpty() else region & mask)
+
+        if region == self._blurRegion:
+            return
+
+        self._blurRegion = region
+        self.windowEffect.enableBlurBehindWindow(self.winId(), region)
+
+    def _grabScreen(self):
+        """ grab and blur the screen under the window """
+        from ..utils.backdrop_blur import blurImage
+
+        self._blurredScreen = None
+        screen = self.screen()
+        pixmap = screen.grabWindow(0)
+        if pixmap.isNull():
+            return
+
+        dpr = screen.devicePixelRatio()
+        image = blurImage(pixmap.toImage(), self.SOFTWARE_BLUR_RADIUS * dpr, self._downsampleFactor)
+        self._blurredScreen = (screen, image)
+
+    def _updateBackdrop(self):
+        """ crop the backdrop of window from the blurred screen and tint it """
+        self._backdrop = None
+        if self._blurredScreen is None or self._blurredScreen[0] is not self.screen():
+            return self.update()
+
+        screen, image = self._blurredScreen
+        scale = screen.devicePixelRatio() / self._downsampleFactor
+        pos = (self.pos() - screen.geometry().topLeft()) * scale
+        rect = QRect(pos, self.size() * scale)
+
+        dpr = self.devicePixelRatioF()
+        backdrop = QPixmap(self.size() * dpr)
+        backdrop.setDevicePixelRatio(dpr)
+
+        painter = QPainter(backdrop)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(QRect(QPoint(0, 0), self.size()), image, rect)
+
+        painter.fillRect(self.rect(), self.windowEffect.acrylicColor)
+        painter.end()
+
+        self._backdrop = backdrop
+        self.update()
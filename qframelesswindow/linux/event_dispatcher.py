@@ -0,0 +1,64 @@
+# coding:utf-8
+from weakref import WeakSet
+
+from PyQt5 import sip
+from PyQt5.QtCore import QCoreApplication, QEvent, QObject
+
+
+class FramelessEventDispatcher(QObject):
+    """ Application-wide event filter shared by all frameless windows
+
+    Only one dispatcher is installed on the application, so the cost of
+    filtering an event does not grow with the number of frameless windows.
+    Mouse press and move events are forwarded to the frameless window
+    which owns the receiver, other events are ignored.
+    """
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._windows = WeakSet()
+
+    @classmethod
+    def instance(cls):
+        """ get the dispatcher of current application, install it if necessary """
+        app = QCoreApplication.instance()
+        # the dispatcher is deleted together with the previous application
+        instance = cls._instance
+        if instance is None or sip.isdeleted(instance) or instance.parent() is not app:
+            cls._instance = cls(app)
+            app.installEventFilter(cls._instance)
+
+        return cls._instance
+
+    def register(self, window):
+        """ register a frameless window
+
+        Parameters
+        ----------
+        window: LinuxFramelessWindow
+            frameless window to receive mouse events
+        """
+        self._windows.add(window)
+
+    def unregister(self, window):
+        """ unregister a frameless window
+
+        Parameters
+        ----------
+        window: LinuxFramelessWindow
+            frameless window to be removed
+        """
+        self._windows.discard(window)
+
+    def eventFilter(self, obj, e):
+        et = e.type()
+        if et != QEvent.MouseMove and et != QEvent.MouseButtonPress or not obj.isWidgetType():
+            return False
+
+        window = obj.window()
+        if window in self._windows:
+            window._handleMouseEvent(obj, e)
+
+        return False
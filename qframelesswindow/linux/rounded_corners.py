@@ -0,0 +1,56 @@
+# coding:utf-8
+from PyQt5.QtGui import QRegion
+
+
+class CornerNotches:
+    """ The regions outside the rounded corners of window
+
+    The notches only depend on the corner radius, so they are created once per
+    radius and translated to the corners of windows of any size.
+    """
+
+    _notches = {}
+
+    def __init__(self, radius):
+        """
+        Parameters
+        ----------
+        radius: int
+            corner radius in device independent pixels
+        """
+        r = self.radius = radius
+        notches = QRegion(0, 0, 2*r, 2*r) - QRegion(0, 0, 2*r, 2*r, QRegion.Ellipse)
+        self.topLeft = notches & QRegion(0, 0, r, r)
+        self.topRight = (notches & QRegion(r, 0, r, r)).translated(-r, 0)
+        self.bottomLeft = (notches & QRegion(0, r, r, r)).translated(0, -r)
+        self.bottomRight = (notches & QRegion(r, r, r, r)).translated(-r, -r)
+
+    @classmethod
+    def get(cls, radius):
+        """ get the shared notches of radius """
+        notches = cls._notches.get(radius)
+        if notches is None:
+            notches = cls._notches[radius] = cls(radius)
+
+        return notches
+
+    def cut(self, region, rect):
+        """ cut the notches at the corners of rect from region
+
+        Parameters
+        ----------
+        region: QRegion
+            the region to be cut
+
+        rect: QRect
+            the rect whose corners are rounded
+
+        Returns
+        -------
+        region: QRegion
+            the region with rounded corners
+        """
+        r = self.radius
+        x, y, right, bottom = rect.x(), rect.y(), rect.x() + rect.width() - r, rect.y() + rect.height() - r
+        return region - self.topLeft.translated(x, y) - self.topRight.translated(right, y) \
+            - self.bottomLeft.translated(x, bottom) - self.bottomRight.translated(right, bottom)
@@ -1,10 +1,21 @@
 # coding:utf-8
+from PyQt5.QtGui import QColor, QRegion
+
+from ..utils import isPlatformX11
+
+BLUR_BEHIND_ATOM = "_KDE_NET_WM_BLUR_BEHIND_REGION"
+
 
 class LinuxWindowEffect:
-    """ Linux window effect """
+    """ Linux window effect
+
+    The blur effects are done by the compositor through `_KDE_NET_WM_BLUR_BEHIND_REGION`,
+    which is supported by KWin and some other X11 compositors.
+    """
 
     def __init__(self, window):
         self.window = window
+        self.acrylicColor = QColor(242, 242, 242, 48)
 
     def setAcrylicEffect(self, hWnd, gradientColor="F2F2F230", isEnableShadow=True, animationId=0):
         """ set acrylic effect for window
@@ -23,7 +34,9 @@ class LinuxWindowEffect:
         animationId: int
             turn on blur animation or not
         """
-        pass
+        self.acrylicColor = QColor("#" + gradientColor[6:] + gradientColor[:6])
+        self.enableBlurBehindWindow(hWnd)
+        self.window.update()
 
     def setMicaEffect(self, hWnd, isDarkMode=False, isAlt=False):
         """ Add mica effect to the window (Win11 only)
@@ -49,7 +62,7 @@ class LinuxWindowEffect:
         hWnd: int or `sip.voidptr`
             Window handle
         """
-        pass
+        self.enableBlurBehindWindow(hWnd)
 
     def setTransparentEffect(self, hWnd):
         """ set transparent effect for window
@@ -69,17 +82,25 @@ class LinuxWindowEffect:
         hWnd : int or `sip.voidptr`
             Window handle
         """
-        pass
+        if not self.isBlurBehindSupported():
+            return
+
+        from ..utils.linux_utils import XcbConnection
+
+        conn = XcbConnection.instance()
+        conn.deleteProperty(int(hWnd), BLUR_BEHIND_ATOM)
+        conn.flush()
 
     def addShadowEffect(self, hWnd):
-        """ add shadow to window
+        """ add the client-side shadow to frameless window
 
         Parameter
         ----------
         hWnd: int or `sip.voidptr`
             Window handle
         """
-        pass
+        if hasattr(self.window, "setShadowEnabled"):
+            self.window.setShadowEnabled(True)
 
     def addMenuShadowEffect(self, hWnd):
         """ add shadow to menu
@@ -103,14 +124,15 @@ class LinuxWindowEffect:
         pass
 
     def removeShadowEffect(self, hWnd):
-        """ Remove shadow from the window
+        """ Remove the client-side shadow from frameless window
 
         Parameters
         ----------
         hWnd: int or `sip.voidptr`
             Window handle
         """
-        pass
+        if hasattr(self.window, "setShadowEnabled"):
+            self.window.setShadowEnabled(False)
 
     @staticmethod
     def addWindowAnimation(hWnd):
@@ -132,10 +154,136 @@ class LinuxWindowEffect:
             Window handle
         """
 
-    def enableBlurBehindWindow(self, hWnd):
+    def enableBlurBehindWindow(self, hWnd, region=QRegion()):
         """ enable the blur effect behind the whole client
         Parameters
         ----------
         hWnd: int or `sip.voidptr`
             Window handle
-        """
\ No newline at end of file
+
+        region: QRegion
+            the blurred region in device pixels, the whole window is blurred if it's
+            empty, so the region needn't be updated when the window is resized
+        """
+        if not self.isBlurBehindSupported():
+            return
+
+        from ..utils.linux_utils import XcbConnection
+
+        values = []
+        for rect in region.rects():
+            values.extend((rect.x(), rect.y(), rect.width(), rect.height()))
+
+        conn = XcbConnection.instance()
+        conn.setCardinalProperty(int(hWnd), BLUR_BEHIND_ATOM, values)
+        conn.flush()
+
+    @staticmethod
+    def isBlurBehindSupported():
+        """ whether the compositor can blur the background of window """
+        if not isPlatformX11():
+            return False
+
+        from ..utils.linux_utils import XcbConnection
+        return XcbConnection.instance().isSupported(BLUR_BEHIND_ATOM)
+
+    def setOpaqueRegion(self, hWnd, region):
+        """ set the opaque region of window, so that the compositor can skip blending it (X11 only)
+
+        Parameters
+        ----------
+        hWnd: int or `sip.voidptr`
+            Window handle
+
+        region: QRegion
+            the opaque region in device pixels, the whole window is considered
+            translucent if it's empty
+        """
+        if not isPlatformX11():
+            return
+
+        from ..utils.linux_utils import XcbConnection
+
+        values = []
+        for rect in region.rects():
+            values.extend((rect.x(), rect.y(), rect.width(), rect.height()))
+
+        conn = XcbConnection.instance()
+        conn.setCardinalProperty(int(hWnd), "_NET_WM_OPAQUE_REGION", values)
+        conn.flush()
+
+    def setCompositorBypass(self, hWnd, isBypassed=None):
+        """ set the `_NET_WM_BYPASS_COMPOSITOR` hint of window (X11 only)
+
+        Parameters
+        ----------
+        hWnd: int or `sip.voidptr`
+            Window handle
+
+        isBypassed: bool | None
+            `True` to ask the compositor to unredirect the window, `False` to keep
+            it composited, `None` to let the compositor decide
+        """
+        if not isPlatformX11():
+            return
+
+        from ..utils.linux_utils import XcbConnection
+
+        # refer to: https://specifications.freedesktop.org/wm-spec/1.4/ar01s05.html
+        hint = 0 if isBypassed is None else (1 if isBypassed else 2)
+        conn = XcbConnection.instance()
+        conn.setCardinalProperty(int(hWnd), "_NET_WM_BYPASS_COMPOSITOR", [hint])
+        conn.flush()
+
+    def setFrameExtents(self, hWnd, margins):
+        """ set the size of client-side decorations through `_GTK_FRAME_EXTENTS` (X11 only)
+
+        Parameters
+        ----------
+        hWnd: int or `sip.voidptr`
+            Window handle
+
+        margins: QMargins
+            the size of client-side shadow in device pixels
+        """
+        if not isPlatformX11():
+            return
+
+        from ..utils.linux_utils import XcbConnection
+
+        conn = XcbConnection.instance()
+        if margins.isNull():
+            conn.deleteProperty(int(hWnd), "_GTK_FRAME_EXTENTS")
+        else:
+            values = [margins.left(), margins.right(), margins.top(), margins.bottom()]
+            conn.setCardinalProperty(int(hWnd), "_GTK_FRAME_EXTENTS", values)
+
+        conn.flush()
+
+    @staticmethod
+    def isSyncRequestSupported(hWnd):
+        """ whether the window takes part in the `_NET_WM_SYNC_REQUEST` protocol (X11 only)
+
+        The protocol is implemented by the xcb platform plugin of Qt when the X
+        server supports the XSync extension and the window manager lists
+        `_NET_WM_SYNC_REQUEST` in `_NET_SUPPORTED` of root window when the
+        application starts, so the window manager waits for the window to paint
+        each size before sending the next one during interactive resizing. This
+        method queries the X server and is intended for diagnosis.
+
+        Parameters
+        ----------
+        hWnd: int or `sip.voidptr`
+            Window handle
+        """
+        if not isPlatformX11():
+            return False
+
+        from xcffib.xproto import Atom
+
+        from ..utils.linux_utils import XcbConnection
+
+        conn = XcbConnection.instance()
+        protocols = conn.getProperty(int(hWnd), "WM_PROTOCOLS", Atom.ATOM)
+        counter = conn.getProperty(int(hWnd), "_NET_WM_SYNC_REQUEST_COUNTER")
+        return conn.atom("_NET_WM_SYNC_REQUEST") in protocols and bool(counter)
@@ -0,0 +1,106 @@
+# coding:utf-8
+from math import erfc, sqrt
+
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QColor, QLinearGradient, QPainter, QPixmap, QRadialGradient
+
+
+class ShadowSlices:
+    """ Nine-slice pixmap of the gaussian shadow of window
+
+    The slices are rendered from gradients once per radius, color and device
+    pixel ratio and shared by all the windows, so drawing the shadow of any
+    size only blits the corners and stretches the edges.
+    """
+
+    STOP_COUNT = 16
+
+    _slices = {}
+
+    def __init__(self, radius, color, dpr):
+        """
+        Parameters
+        ----------
+        radius: int
+            the radius of shadow in device independent pixels
+
+        color: QColor
+            the color of shadow at the edge of window
+
+        dpr: float
+            device pixel ratio
+        """
+        self.radius = radius
+        self.pixmap = self._render(max(1, round(radius * dpr)), color)
+
+    @classmethod
+    def get(cls, radius, color, dpr):
+        """ get the shared slices """
+        key = (radius, color.rgba(), dpr)
+        slices = cls._slices.get(key)
+        if slices is None:
+            slices = cls._slices[key] = cls(radius, QColor(color), dpr)
+
+        return slices
+
+    def draw(self, painter, rect):
+        """ draw the shadow around a rectangle
+
+        Parameters
+        ----------
+        painter: QPainter
+            painter
+
+        rect: QRect
+            the rectangle of window without shadow
+        """
+        r = self.radius
+        R = (self.pixmap.width() - 1) // 2
+        x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
+
+        # the pixels of corners are blitted and the one pixel wide edges are stretched
+        for tx, ty, tw, th, sx, sy, sw, sh in (
+            (x - r, y - r, r, r, 0, 0, R, R),
+            (x, y - r, w, r, R, 0, 1, R),
+            (x + w, y - r, r, r, R + 1, 0, R, R),
+            (x - r, y, r, h, 0, R, R, 1),
+            (x + w, y, r, h, R + 1, R, R, 1),
+            (x - r, y + h, r, r, 0, R + 1, R, R),
+            (x, y + h, w, r, R, R + 1, 1, R),
+            (x + w, y + h, r, r, R + 1, R + 1, R, R),
+        ):
+            painter.drawPixmap(QRectF(tx, ty, tw, th), self.pixmap, QRectF(sx, sy, sw, sh))
+
+    def _render(self, R, color):
+        """ render the slices, the window occupies the center pixel of pixmap """
+        pixmap = QPixmap(2*R + 1, 2*R + 1)
+        pixmap.fill(Qt.transparent)
+
+        # the shadow of a box blurred by a gaussian falls off as erfc
+        sigma = R / 3
+        stops = []
+        for i in range(self.STOP_COUNT + 1):
+            t = i / self.STOP_COUNT
+            c = QColor(color)
+            c.setAlphaF(color.alphaF() * erfc(t * R / (sigma * sqrt(2))) / 2)
+            stops.append((t, c))
+
+        painter = QPainter(pixmap)
+        painter.setPen(Qt.NoPen)
+
+        for cx, cy, rect in ((R, R, QRectF(0, 0, R, R)), (R + 1, R, QRectF(R + 1, 0, R, R)),
+                             (R, R + 1, QRectF(0, R + 1, R, R)), (R + 1, R + 1, QRectF(R + 1, R + 1, R, R))):
+            gradient = QRadialGradient(QPointF(cx, cy), R)
+            gradient.setStops(stops)
+            painter.fillRect(rect, gradient)
+
+        for start, end, rect in ((QPointF(0, R), QPointF(0, 0), QRectF(R, 0, 1, R)),
+                                 (QPointF(0, R + 1), QPointF(0, 2*R + 1), QRectF(R, R + 1, 1, R)),
+                                 (QPointF(R, 0), QPointF(0, 0), QRectF(0, R, R, 1)),
+                                 (QPointF(R + 1, 0), QPointF(2*R + 1, 0), QRectF(R + 1, R, R, 1))):
+            gradient = QLinearGradient(start, end)
+            gradient.setStops(stops)
+            painter.fillRect(rect, gradient)
+
+        painter.end()
+        return pixmap
@@ -5,6 +5,7 @@ from PyQt5.QtCore import QEvent, Qt
 from PyQt5.QtWidgets import QWidget
 
 from ..titlebar import TitleBar
+from ..utils.live_resize import LiveResizeTracker
 from .window_effect import MacWindowEffect
 
 
@@ -20,6 +21,7 @@ class MacFramelessWindow(QWidget):
 
         self.titleBar = TitleBar(self)
         self._isResizeEnabled = True
+        self._liveResize = LiveResizeTracker(self, self._updateTitleBarGeometry)
 
         self.updateFrameless()
 
@@ -52,8 +54,48 @@ class MacFramelessWindow(QWidget):
         """ set whether resizing is enabled """
         self._isResizeEnabled = isEnabled
 
+    @property
+    def liveResizeStarted(self):
+        """ signal emitted when the window starts to be moved or resized interactively """
+        return self._liveResize.started
+
+    @property
+    def liveResizeFinished(self):
+        """ signal emitted when the interactive move or resize of window finishes """
+        return self._liveResize.finished
+
+    def isLiveResizing(self):
+        """ whether the window is moved or resized interactively """
+        return self._liveResize.isActive()
+
+    def setSnapshotResizeEnabled(self, isEnabled: bool, isStretched=True):
+        """ set whether to show a snapshot of content instead of laying it out during live resize
+
+        Parameters
+        ----------
+        isEnabled: bool
+            whether to enable snapshot resizing
+
+        isStretched: bool
+            whether to stretch the snapshot to the size of window, otherwise the
+            snapshot is padded with the window color
+        """
+        self._liveResize.setSnapshotEnabled(isEnabled, isStretched)
+
+    def isSnapshotResizeEnabled(self):
+        """ whether snapshot resizing is enabled """
+        return self._liveResize.isSnapshotEnabled()
+
     def resizeEvent(self, e):
         super().resizeEvent(e)
+        if not self._liveResize.requestUpdate():
+            self._updateTitleBarGeometry()
+
+    def moveEvent(self, e):
+        super().moveEvent(e)
+        self._liveResize.notifyMoved()
+
+    def _updateTitleBarGeometry(self):
         self.titleBar.resize(self.width(), self.titleBar.height())
 
     def paintEvent(self, e):
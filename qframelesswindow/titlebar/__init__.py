@@ -1,13 +1,16 @@
 # coding:utf-8
 import sys
 
-from PyQt5.QtCore import QEvent, Qt
-from PyQt5.QtGui import QIcon
+from PyQt5 import sip
+from PyQt5.QtCore import QEvent, QPoint, QRect, Qt
+from PyQt5.QtGui import QIcon, QRegion
 from PyQt5.QtWidgets import QHBoxLayout, QLabel, QWidget
 
 from ..utils import startSystemMove
+from .drag_region import DragRegionIndex
 from .title_bar_buttons import (CloseButton, MaximizeButton, MinimizeButton,
-                                SvgTitleBarButton, TitleBarButton)
+                                SvgTitleBarButton, TitleBarButton,
+                                TitleBarButtonStyle)
 
 
 class TitleBarBase(QWidget):
@@ -15,6 +18,18 @@ class TitleBarBase(QWidget):
 
     def __init__(self, parent):
         super().__init__(parent)
+        # the geometry of buttons is cached and only updated after the buttons notify the title bar
+        self._buttons = set()
+        self._buttonsWidth = 0
+        self._pressedButtonCount = 0
+        self._isButtonsDirty = True
+
+        # custom drag and no-drag areas, the spatial index is rebuilt lazily
+        self._dragAreas = []
+        self._dragWidgets = set()
+        self._dragRegionIndex = DragRegionIndex()
+        self._isDragRegionDirty = False
+
         self.minBtn = MinimizeButton(parent=self)
         self.closeBtn = CloseButton(parent=self)
         self.maxBtn = MaximizeButton(parent=self)
@@ -36,9 +51,22 @@ class TitleBarBase(QWidget):
             if e.type() == QEvent.WindowStateChange:
                 self.maxBtn.setMaxState(self.window().isMaximized())
                 return False
+        elif e.type() in (QEvent.Show, QEvent.Hide, QEvent.Resize, QEvent.Move):
+            if obj in self._dragWidgets:
+                self._isDragRegionDirty = True
 
         return super().eventFilter(obj, e)
 
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._isDragRegionDirty = True
+
+    def childEvent(self, e):
+        if e.type() in (QEvent.ChildAdded, QEvent.ChildRemoved):
+            self._isButtonsDirty = True
+
+        super().childEvent(e)
+
     def mouseDoubleClickEvent(self, event):
         """ Toggles the maximization state of the window """
         if event.button() != Qt.LeftButton or not self._isDoubleClickEnabled:
@@ -71,16 +99,132 @@ class TitleBarBase(QWidget):
 
     def _isDragRegion(self, pos):
         """ Check whether the position belongs to the area where dragging is allowed """
-        width = 0
-        for button in self.findChildren(TitleBarButton):
-            if button.isVisible():
-                width += button.width()
+        if self._dragAreas:
+            if self._isDragRegionDirty:
+                self._updateDragRegionIndex()
+
+            isDrag = self._dragRegionIndex.query(pos.x(), pos.y())
+            if isDrag is not None:
+                return isDrag
 
-        return 0 < pos.x() < self.width() - width
+        if self._isButtonsDirty:
+            self._updateButtons()
+
+        return 0 < pos.x() < self.width() - self._buttonsWidth
 
     def _hasButtonPressed(self):
         """ whether any button is pressed """
-        return any(btn.isPressed() for btn in self.findChildren(TitleBarButton))
+        if self._isButtonsDirty:
+            self._updateButtons()
+
+        return self._pressedButtonCount > 0
+
+    def _updateButtons(self):
+        """ update the cached width of visible buttons and the number of pressed buttons """
+        buttons = set(self.findChildren(TitleBarButton))
+        for button in buttons - self._buttons:
+            button.pressStateChanged.connect(self._onButtonPressStateChanged)
+            button.destroyed.connect(self._invalidateButtons)
+
+        self._buttons = buttons
+        self._buttonsWidth = sum(btn.width() for btn in buttons if btn.isVisible())
+        self._pressedButtonCount = sum(btn.isPressed() for btn in buttons)
+        self._isButtonsDirty = False
+
+    def _invalidateButtons(self):
+        """ mark the cached geometry of buttons dirty, the buttons call it when they are shown, hidden or resized """
+        self._isButtonsDirty = True
+
+    def _onButtonPressStateChanged(self, isPressed):
+        if self._isButtonsDirty or self.sender() not in self._buttons:
+            return
+
+        self._pressedButtonCount += 1 if isPressed else -1
+
+    def _updateDragRegionIndex(self):
+        """ rebuild the spatial index of custom drag and no-drag areas """
+        self._dragWidgets = {w for w in self._dragWidgets if not sip.isdeleted(w)}
+        self._dragAreas = [i for i in self._dragAreas if not (isinstance(i[0], QWidget) and sip.isdeleted(i[0]))]
+
+        rects = []
+        for area, isDrag in self._dragAreas:
+            if not isinstance(area, QWidget):
+                rects.extend((rect, isDrag) for rect in QRegion(area).rects())
+            elif area.isVisible():
+                if self.isAncestorOf(area):
+                    pos = area.mapTo(self, QPoint())
+                else:
+                    pos = self.mapFromGlobal(area.mapToGlobal(QPoint()))
+
+                rects.append((QRect(pos, area.size()), isDrag))
+
+        self._dragRegionIndex.build(rects)
+        self._isDragRegionDirty = False
+
+    def _invalidateDragRegions(self):
+        self._isDragRegionDirty = True
+
+    def _addDragArea(self, area, isDrag):
+        if isinstance(area, QWidget) and area not in self._dragWidgets:
+            self._dragWidgets.add(area)
+            area.installEventFilter(self)
+            area.destroyed.connect(self._invalidateDragRegions)
+
+        self._dragAreas.append((area, isDrag))
+        self._isDragRegionDirty = True
+
+    def addDragRegion(self, region):
+        """ allow dragging the window in the region, even if it is covered by buttons
+
+        Parameters
+        ----------
+        region: QRect | QRegion | QWidget
+            the region in title bar coordinates, or a widget whose geometry is used
+        """
+        self._addDragArea(region, True)
+
+    def addNoDragRegion(self, region):
+        """ forbid dragging the window in the region, it takes precedence over drag regions
+
+        Parameters
+        ----------
+        region: QRect | QRegion | QWidget
+            the region in title bar coordinates, or a widget whose geometry is used
+        """
+        self._addDragArea(region, False)
+
+    def removeDragRegion(self, region):
+        """ remove the drag or no-drag region
+
+        Parameters
+        ----------
+        region: QRect | QRegion | QWidget
+            the region added by `addDragRegion()` or `addNoDragRegion()`
+        """
+        def isSame(area):
+            if isinstance(area, QWidget) or isinstance(region, QWidget):
+                return area is region
+
+            return QRegion(area) == QRegion(region)
+
+        self._dragAreas = [i for i in self._dragAreas if not isSame(i[0])]
+        self._isDragRegionDirty = True
+
+        if isinstance(region, QWidget) and region in self._dragWidgets:
+            self._dragWidgets.discard(region)
+            region.removeEventFilter(self)
+            region.destroyed.disconnect(self._invalidateDragRegions)
+
+    def clearDragRegions(self):
+        """ remove all the drag and no-drag regions """
+        for widget in self._dragWidgets:
+            if not sip.isdeleted(widget):
+                widget.removeEventFilter(self)
+                widget.destroyed.disconnect(self._invalidateDragRegions)
+
+        self._dragAreas.clear()
+        self._dragWidgets.clear()
+        self._isDragRegionDirty = True
 
     def canDrag(self, pos):
         """ whether the position is draggable """
@@ -0,0 +1,73 @@
+# coding:utf-8
+from PyQt5 import sip
+from PyQt5.QtCore import QCoreApplication, QElapsedTimer, QObject, Qt, QTimer
+
+
+class AnimationClock(QObject):
+    """ Process-wide clock which drives the transitions of all title bar buttons
+
+    All the running transitions are advanced in one timer callback per frame,
+    and the timer is stopped as soon as no transition is running.
+    """
+
+    FRAME_INTERVAL = 16
+
+    _instance = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._targets = set()
+        self._elapsedTimer = QElapsedTimer()
+        self._elapsedTimer.start()
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(self.FRAME_INTERVAL)
+        self._timer.timeout.connect(self._tick)
+
+    @classmethod
+    def instance(cls):
+        """ get the clock of current application """
+        app = QCoreApplication.instance()
+        # the clock is deleted together with the previous application
+        instance = cls._instance
+        if instance is None or sip.isdeleted(instance) or instance.parent() is not app:
+            cls._instance = cls(app)
+
+        return cls._instance
+
+    def now(self):
+        """ get the current time of clock in milliseconds """
+        return self._elapsedTimer.elapsed()
+
+    def isActive(self):
+        """ whether the clock is ticking """
+        return self._timer.isActive()
+
+    def add(self, target):
+        """ add an animation target, the clock starts ticking if necessary
+
+        Parameters
+        ----------
+        target: TitleBarButton
+            the target whose `_advanceTransition(now)` method is called every frame,
+            the target is removed when the method returns `True`
+        """
+        self._targets.add(target)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def remove(self, target):
+        """ remove an animation target """
+        self._targets.discard(target)
+        if not self._targets:
+            self._timer.stop()
+
+    def _tick(self):
+        now = self.now()
+        for target in list(self._targets):
+            if sip.isdeleted(target) or target._advanceTransition(now):
+                self._targets.discard(target)
+
+        if not self._targets:
+            self._timer.stop()
@@ -0,0 +1,61 @@
+# coding:utf-8
+from bisect import bisect_right
+
+
+class DragRegionIndex:
+    """ Spatial index of the drag and no-drag areas of title bar
+
+    The title bar is split into vertical slabs by the left and right edges of
+    all areas, so a lookup is a binary search on x followed by a scan of the
+    few areas which overlap the slab.
+    """
+
+    def __init__(self, areas=()):
+        """
+        Parameters
+        ----------
+        areas: Iterable[Tuple[QRect, bool]]
+            rectangles and whether dragging is allowed inside them
+        """
+        self._xs = []
+        self._slabs = []
+        self.build(areas)
+
+    def build(self, areas):
+        """ rebuild the index
+
+        Parameters
+        ----------
+        areas: Iterable[Tuple[QRect, bool]]
+            rectangles and whether dragging is allowed inside them
+        """
+        rects = [(r.left(), r.right() + 1, r.top(), r.bottom() + 1, isDrag)
+                 for r, isDrag in areas if not r.isEmpty()]
+
+        self._xs = sorted({x for r in rects for x in r[:2]})
+        self._slabs = []
+        for x0, x1 in zip(self._xs, self._xs[1:]):
+            # no-drag areas are placed in front of drag areas
+            slab = [(top, bottom, isDrag) for left, right, top, bottom, isDrag in rects
+                    if left < x1 and right > x0]
+            slab.sort(key=lambda i: i[2])
+            self._slabs.append(tuple(slab))
+
+    def query(self, x, y):
+        """ query whether dragging is allowed at the position
+
+        Returns
+        -------
+        isDrag: bool | None
+            `False` if the position is in a no-drag area, `True` if it is in a drag
+            area, `None` if it is not covered by any area
+        """
+        i = bisect_right(self._xs, x) - 1
+        if i < 0 or i >= len(self._slabs):
+            return None
+
+        for top, bottom, isDrag in self._slabs[i]:
+            if top <= y < bottom:
+                return isDrag
+
+        return None
@@ -0,0 +1,118 @@
+# coding:utf-8
+from collections import OrderedDict
+
+
+class IconCache:
+    """ Process-wide LRU cache of the rendered icons of title bar buttons
+
+    The key of pixmap is `(iconKey, rgba, width, height, devicePixelRatio)`.
+    Buttons retain the `(iconKey, rgba)` pairs they use, and the pixmaps are
+    removed as soon as no button uses them.
+    """
+
+    def __init__(self, limit=4096):
+        """
+        Parameters
+        ----------
+        limit: int
+            the memory limit of cache in kilobytes
+        """
+        self._pixmaps = OrderedDict()
+        self._refs = {}
+        self._cost = 0
+        self._limit = limit * 1024
+
+    def cacheLimit(self):
+        """ get the memory limit of cache in kilobytes """
+        return self._limit // 1024
+
+    def setCacheLimit(self, limit):
+        """ set the memory limit of cache, the cache is disabled if `limit` is 0
+
+        Parameters
+        ----------
+        limit: int
+            the memory limit of cache in kilobytes
+        """
+        self._limit = limit * 1024
+        self._evict()
+
+    def cost(self):
+        """ get the memory used by cached pixmaps in bytes """
+        return self._cost
+
+    def find(self, key):
+        """ find the pixmap of key, return `None` if it's not cached """
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+
+        return pixmap
+
+    def insert(self, key, pixmap):
+        """ insert a pixmap, the least recently used pixmaps are removed if the cache is full
+
+        Parameters
+        ----------
+        key: Hashable
+            the key of pixmap
+
+        pixmap: QPixmap
+            rendered pixmap
+        """
+        self.remove(key)
+        self._pixmaps[key] = pixmap
+        self._cost += self._pixmapCost(pixmap)
+        self._evict()
+
+    def remove(self, key):
+        """ remove the pixmap of key """
+        pixmap = self._pixmaps.pop(key, None)
+        if pixmap is not None:
+            self._cost -= self._pixmapCost(pixmap)
+
+    def retain(self, refs):
+        """ increase the reference count of icons
+
+        Parameters
+        ----------
+        refs: Iterable[Tuple[Hashable, int]]
+            the icon keys and rgba values of icon colors
+        """
+        for ref in refs:
+            self._refs[ref] = self._refs.get(ref, 0) + 1
+
+    def release(self, refs):
+        """ decrease the reference count of icons, the pixmaps of unused icons are removed
+
+        Parameters
+        ----------
+        refs: Iterable[Tuple[Hashable, int]]
+            the icon keys and rgba values of icon colors
+        """
+        for ref in refs:
+            count = self._refs.get(ref, 0) - 1
+            if count > 0:
+                self._refs[ref] = count
+                continue
+
+            self._refs.pop(ref, None)
+            for key in [k for k in self._pixmaps if k[:2] == ref]:
+                self.remove(key)
+
+    def clear(self):
+        """ remove all the pixmaps """
+        self._pixmaps.clear()
+        self._cost = 0
+
+    def _evict(self):
+        while self._cost > self._limit and self._pixmaps:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._cost -= self._pixmapCost(pixmap)
+
+    @staticmethod
+    def _pixmapCost(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+iconCache = IconCache()
@@ -0,0 +1,93 @@
+# coding:utf-8
+from itertools import count
+
+from PyQt5.QtCore import QFile
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtXml import QDomDocument
+
+from .._rc import isResourcePath, registerResources
+
+
+class SvgIcon:
+    """ Svg icon data shared by all the title bar buttons using the same icon """
+
+    _icons = {}
+    _copyIds = count(1)
+
+    def __init__(self, document, source, isShared=False):
+        """
+        Parameters
+        ----------
+        document: QDomDocument
+            parsed svg document
+
+        source: str
+            the path of svg file
+
+        isShared: bool
+            whether the icon is shared by buttons
+        """
+        self.source = source
+        self.key = source if isShared else (source, next(self._copyIds))
+        self._document = document
+
+    @classmethod
+    def fromFile(cls, path):
+        """ get the shared icon of svg file, the file is only parsed once
+
+        Parameters
+        ----------
+        path: str
+            the path of svg file
+        """
+        icon = cls._icons.get(path)
+        if icon is not None:
+            return icon
+
+        if isResourcePath(path):
+            registerResources()
+
+        document = QDomDocument()
+        f = QFile(path)
+        f.open(QFile.ReadOnly)
+        document.setContent(f.readAll())
+        f.close()
+
+        icon = cls._icons[path] = cls(document, path, True)
+        return icon
+
+    def copy(self):
+        """ create a private copy of icon, which can be customized without affecting other buttons """
+        document = self._document.cloneNode(True).toDocument()
+        return SvgIcon(document, self.source)
+
+    def invalidate(self):
+        """ change the key of icon after the document is modified, so the stale rendered icons are not used """
+        self.key = (self.source, next(self._copyIds))
+
+    def document(self):
+        """ get the svg document of icon """
+        return self._document
+
+    def render(self, painter, rect, color):
+        """ render the icon with the specified stroke color
+
+        Parameters
+        ----------
+        painter: QPainter
+            painter
+
+        rect: QRectF
+            the target rect
+
+        color: QColor
+            stroke color
+        """
+        color = color.name()
+        pathNodes = self._document.elementsByTagName('path')
+        for i in range(pathNodes.length()):
+            element = pathNodes.at(i).toElement()
+            element.setAttribute('stroke', color)
+
+        renderer = QSvgRenderer(self._document.toByteArray())
+        renderer.render(painter, rect)
@@ -1,13 +1,15 @@
 # coding:utf-8
 from enum import Enum
+from functools import partial
+from weakref import WeakSet, WeakValueDictionary
 
-from PyQt5.QtCore import QFile, QPointF, QRectF, Qt, pyqtProperty
-from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPen
+from PyQt5 import sip
+from PyQt5.QtCore import QPointF, QRectF, Qt, pyqtProperty, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter, QPainterPath, QPen, QPixmap
 from PyQt5.QtWidgets import QAbstractButton
-from PyQt5.QtSvg import QSvgRenderer
-from PyQt5.QtXml import QDomDocument
 
-from .._rc import resource
+from .animation import AnimationClock
+from .icon_cache import iconCache
 
 
 class TitleBarButtonState(Enum):
@@ -17,24 +19,88 @@ class TitleBarButtonState(Enum):
     PRESSED = 2
 
 
+class TitleBarButtonStyle:
+    """ Immutable colors of title bar button
+
+    Styles with the same colors are the same object, so the buttons of all
+    windows share a few style objects instead of owning six colors each.
+    """
+
+    __slots__ = ("normalColor", "hoverColor", "pressedColor", "normalBackgroundColor",
+                 "hoverBackgroundColor", "pressedBackgroundColor", "__weakref__")
+
+    _styles = WeakValueDictionary()
+
+    def __new__(cls, normalColor=QColor(0, 0, 0), hoverColor=QColor(0, 0, 0), pressedColor=QColor(0, 0, 0),
+                normalBackgroundColor=QColor(0, 0, 0, 0), hoverBackgroundColor=QColor(0, 0, 0, 26),
+                pressedBackgroundColor=QColor(0, 0, 0, 51)):
+        """
+        Parameters
+        ----------
+        normalColor, hoverColor, pressedColor: QColor
+            the icon color in normal, hover and pressed state
+
+        normalBackgroundColor, hoverBackgroundColor, pressedBackgroundColor: QColor
+            the background color in normal, hover and pressed state
+        """
+        colors = [QColor(c) for c in (normalColor, hoverColor, pressedColor, normalBackgroundColor,
+                                      hoverBackgroundColor, pressedBackgroundColor)]
+        key = tuple(c.rgba() for c in colors)
+        style = cls._styles.get(key)
+        if style is not None:
+            return style
+
+        style = super().__new__(cls)
+        for name, color in zip(cls.__slots__, colors):
+            object.__setattr__(style, name, color)
+
+        cls._styles[key] = style
+        return style
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TitleBarButtonStyle is immutable, use `replace()` to create a new style")
+
+    def replace(self, **colors):
+        """ create a style with some colors replaced
+
+        Parameters
+        ----------
+        **colors:
+            the colors to be replaced, e.g. `hoverColor=Qt.white`
+        """
+        kwargs = {name: getattr(self, name) for name in self.__slots__[:-1]}
+        kwargs.update(colors)
+        return TitleBarButtonStyle(**kwargs)
+
+
 class TitleBarButton(QAbstractButton):
     """ Title bar button """
 
+    pressStateChanged = pyqtSignal(bool)
+
+    defaultStyle = TitleBarButtonStyle()
+
+    # all the title bar buttons and the styles of application theme
+    _buttons = WeakSet()
+    _themeStyles = {}
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self.setCursor(Qt.ArrowCursor)
         self.setFixedSize(46, 32)
         self._state = TitleBarButtonState.NORMAL
+        self._style = self._themeStyle(type(self))
+        TitleBarButton._buttons.add(self)
 
-        # icon color
-        self._normalColor = QColor(0, 0, 0)
-        self._hoverColor = QColor(0, 0, 0)
-        self._pressedColor = QColor(0, 0, 0)
+        # color transition between states, disabled by default
+        self._transitionDuration = 0
+        self._transition = None
+        self._transitionProgress = 1.0
 
-        # background color
-        self._normalBgColor = QColor(0, 0, 0, 0)
-        self._hoverBgColor = QColor(0, 0, 0, 26)
-        self._pressedBgColor = QColor(0, 0, 0, 51)
+        # the rendered icons used by button, they are released after the button is destroyed
+        self._iconRefs = []
+        self._updateIconRefs()
+        self.destroyed.connect(partial(iconCache.release, self._iconRefs))
 
     def setState(self, state):
         """ set the state of button
@@ -44,36 +110,113 @@ class TitleBarButton(QAbstractButton):
         state: TitleBarButtonState
             the state of button
         """
+        isPressed = state == TitleBarButtonState.PRESSED
+        isPressStateChanged = isPressed != self.isPressed()
+
+        if self._transitionDuration > 0 and state != self._state and self.isVisible():
+            clock = AnimationClock.instance()
+            self._transition = (self._state, clock.now(), self._transitionDuration)
+            self._transitionProgress = 0.0
+            clock.add(self)
+        else:
+            self._stopTransition()
+
         self._state = state
         self.update()
 
+        if isPressStateChanged:
+            self.pressStateChanged.emit(isPressed)
+
     def isPressed(self):
         """ whether the button is pressed """
         return self._state == TitleBarButtonState.PRESSED
 
+    def buttonStyle(self):
+        """ get the style of button """
+        return self._style
+
+    def setButtonStyle(self, style):
+        """ set the style of button, the button is repainted at most once
+
+        Parameters
+        ----------
+        style: TitleBarButtonStyle
+            the style of button
+        """
+        if style is self._style:
+            return
+
+        old, self._style = self._style, style
+        if (old.normalColor, old.hoverColor, old.pressedColor) != (style.normalColor, style.hoverColor, style.pressedColor):
+            self._updateIconRefs()
+
+        self.update()
+
+    @classmethod
+    def setThemeStyles(cls, styles):
+        """ switch the style of all the title bar buttons of all windows in one pass
+
+        Parameters
+        ----------
+        styles: Dict[type, TitleBarButtonStyle]
+            the button classes and their styles, a button uses the style of the nearest
+            class in its mro, e.g. `{TitleBarButton: style, CloseButton: closeStyle}`.
+            The buttons created later use these styles too.
+        """
+        TitleBarButton._themeStyles = dict(styles)
+        for button in list(TitleBarButton._buttons):
+            if not sip.isdeleted(button):
+                button.setButtonStyle(cls._themeStyle(type(button)))
+
+    @staticmethod
+    def _themeStyle(buttonType):
+        """ get the style of button class in current theme """
+        for c in buttonType.__mro__:
+            if c in TitleBarButton._themeStyles:
+                return TitleBarButton._themeStyles[c]
+            if "defaultStyle" in c.__dict__:
+                return c.defaultStyle
+
+        return TitleBarButton.defaultStyle
+
+    def getTransitionDuration(self):
+        """ get the duration of color transition in milliseconds """
+        return self._transitionDuration
+
+    def setTransitionDuration(self, duration):
+        """ set the duration of color transition between states
+
+        Parameters
+        ----------
+        duration: int
+            the duration in milliseconds, the colors change instantly if it's 0
+        """
+        self._transitionDuration = max(0, duration)
+        self._stopTransition()
+
     def getNormalColor(self):
         """ get the icon color of the button in normal state """
-        return self._normalColor
+        return QColor(self._style.normalColor)
 
     def getHoverColor(self):
         """ get the icon color of the button in hover state """
-        return self._hoverColor
+        return QColor(self._style.hoverColor)
 
     def getPressedColor(self):
         """ get the icon color of the button in pressed state """
-        return self._pressedColor
+        return QColor(self._style.pressedColor)
 
     def getNormalBackgroundColor(self):
         """ get the background color of the button in normal state """
-        return self._normalBgColor
+        return QColor(self._style.normalBackgroundColor)
 
     def getHoverBackgroundColor(self):
         """ get the background color of the button in hover state """
-        return self._hoverBgColor
+        return QColor(self._style.hoverBackgroundColor)
 
     def getPressedBackgroundColor(self):
         """ get the background color of the button in pressed state """
-        return self._pressedBgColor
+        return QColor(self._style.pressedBackgroundColor)
 
     def setNormalColor(self, color):
         """ set the icon color of the button in normal state
@@ -83,8 +226,7 @@ class TitleBarButton(QAbstractButton):
         color: QColor
             icon color
         """
-        self._normalColor = QColor(color)
-        self.update()
+        self.setButtonStyle(self._style.replace(normalColor=color))
 
     def setHoverColor(self, color):
         """ set the icon color of the button in hover state
@@ -94,8 +236,7 @@ class TitleBarButton(QAbstractButton):
         color: QColor
             icon color
         """
-        self._hoverColor = QColor(color)
-        self.update()
+        self.setButtonStyle(self._style.replace(hoverColor=color))
 
     def setPressedColor(self, color):
         """ set the icon color of the button in pressed state
@@ -105,8 +246,7 @@ class TitleBarButton(QAbstractButton):
         color: QColor
             icon color
         """
-        self._pressedColor = QColor(color)
-        self.update()
+        self.setButtonStyle(self._style.replace(pressedColor=color))
 
     def setNormalBackgroundColor(self, color):
         """ set the background color of the button in normal state
@@ -116,8 +256,7 @@ class TitleBarButton(QAbstractButton):
         color: QColor
             background color
         """
-        self._normalBgColor = QColor(color)
-        self.update()
+        self.setButtonStyle(self._style.replace(normalBackgroundColor=color))
 
     def setHoverBackgroundColor(self, color):
         """ set the background color of the button in hover state
@@ -127,8 +266,7 @@ class TitleBarButton(QAbstractButton):
         color: QColor
             background color
         """
-        self._hoverBgColor = QColor(color)
-        self.update()
+        self.setButtonStyle(self._style.replace(hoverBackgroundColor=color))
 
     def setPressedBackgroundColor(self, color):
         """ set the background color of the button in pressed state
@@ -138,8 +276,7 @@ class TitleBarButton(QAbstractButton):
         color: QColor
             background color
         """
-        self._pressedBgColor = QColor(color)
-        self.update()
+        self.setButtonStyle(self._style.replace(pressedBackgroundColor=color))
 
     def enterEvent(self, e):
         self.setState(TitleBarButtonState.HOVER)
@@ -156,14 +293,140 @@ class TitleBarButton(QAbstractButton):
         self.setState(TitleBarButtonState.PRESSED)
         super().mousePressEvent(e)
 
-    def _getColors(self):
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._invalidateTitleBar()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._invalidateTitleBar()
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._invalidateTitleBar()
+
+    def _invalidateTitleBar(self):
+        """ notify the title bar which contains the button that the buttons changed """
+        parent = self.parentWidget()
+        while parent is not None:
+            if hasattr(parent, "_invalidateButtons"):
+                return parent._invalidateButtons()
+
+            parent = parent.parentWidget()
+
+    def _getColors(self, state=None):
         """ get the icon color and background color """
-        if self._state == TitleBarButtonState.NORMAL:
-            return self._normalColor, self._normalBgColor
-        elif self._state == TitleBarButtonState.HOVER:
-            return self._hoverColor, self._hoverBgColor
+        state = self._state if state is None else state
+        if state == TitleBarButtonState.NORMAL:
+            return self._style.normalColor, self._style.normalBackgroundColor
+        elif state == TitleBarButtonState.HOVER:
+            return self._style.hoverColor, self._style.hoverBackgroundColor
+
+        return self._style.pressedColor, self._style.pressedBackgroundColor
+
+    def _advanceTransition(self, now):
+        """ advance the color transition, return `True` if the transition is finished """
+        if self._transition is None:
+            return True
+
+        _, start, duration = self._transition
+        progress = (now - start) / duration
+        if progress >= 1:
+            self._transition = None
+        else:
+            self._transitionProgress = progress
+
+        self.update()
+        return self._transition is None
 
-        return self._pressedColor, self._pressedBgColor
+    def _stopTransition(self):
+        """ stop the running color transition """
+        if self._transition is None:
+            return
+
+        self._transition = None
+        AnimationClock.instance().remove(self)
+        self.update()
+
+    @staticmethod
+    def _mixColors(c1, c2, t):
+        """ linear interpolation between two colors """
+        return QColor.fromRgbF(*(a + (b - a)*t for a, b in zip(c1.getRgbF(), c2.getRgbF())))
+
+    def paintEvent(self, e):
+        painter = QPainter(self)
+        color, bgColor = self._getColors()
+
+        fromColor = None
+        if self._transition is not None:
+            t = self._transitionProgress
+            fromColor, fromBgColor = self._getColors(self._transition[0])
+            bgColor = self._mixColors(fromBgColor, bgColor, t)
+
+        # draw background
+        painter.setBrush(bgColor)
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(self.rect())
+
+        # draw icon, cross-fade the cached icons during transition
+        if self._iconKey() is None:
+            return
+
+        if fromColor is not None and fromColor != color:
+            painter.setOpacity(1 - t)
+            painter.drawPixmap(0, 0, self._iconPixmap(fromColor))
+            painter.setOpacity(t)
+
+        painter.drawPixmap(0, 0, self._iconPixmap(color))
+
+    def _iconKey(self):
+        """ get the key of current icon, `None` if the button has no icon """
+        return None
+
+    def _iconKeys(self):
+        """ get the keys of all icons which may be painted by the button """
+        key = self._iconKey()
+        return () if key is None else (key,)
+
+    def _drawIcon(self, painter, color):
+        """ draw the icon with the specified color, the result is cached in `iconCache`
+
+        Parameters
+        ----------
+        painter: QPainter
+            the painter of icon pixmap, which has the same size as button
+
+        color: QColor
+            icon color
+        """
+        pass
+
+    def _iconPixmap(self, color):
+        """ get the rendered icon from the shared icon cache """
+        dpr = self.devicePixelRatioF()
+        key = (self._iconKey(), color.rgba(), self.width(), self.height(), dpr)
+        pixmap = iconCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        self._drawIcon(painter, color)
+        painter.end()
+
+        iconCache.insert(key, pixmap)
+        return pixmap
+
+    def _updateIconRefs(self):
+        """ retain the rendered icons used by button and release the stale ones """
+        colors = (self._style.normalColor, self._style.hoverColor, self._style.pressedColor)
+        refs = [(key, c.rgba()) for key in self._iconKeys() for c in colors]
+        iconCache.retain(refs)
+        iconCache.release(self._iconRefs)
+        self._iconRefs[:] = refs
 
     normalColor = pyqtProperty(QColor, getNormalColor, setNormalColor)
     hoverColor = pyqtProperty(QColor, getHoverColor, setHoverColor)
@@ -174,11 +437,15 @@ class TitleBarButton(QAbstractButton):
         QColor, getHoverBackgroundColor, setHoverBackgroundColor)
     pressedBackgroundColor = pyqtProperty(
         QColor, getPressedBackgroundColor, setPressedBackgroundColor)
+    transitionDuration = pyqtProperty(int, getTransitionDuration, setTransitionDuration)
 
 
 class SvgTitleBarButton(TitleBarButton):
     """ Title bar button using svg icon """
 
+    _icon = None
+    _iconPath = None
+
     def __init__(self, iconPath, parent=None):
         """
         Parameters
@@ -190,57 +457,64 @@ class SvgTitleBarButton(TitleBarButton):
             parent widget
         """
         super().__init__(parent)
-        self._svgDom = QDomDocument()
+        self._isIconShared = True
         self.setIcon(iconPath)
 
     def setIcon(self, iconPath):
-        """ set the icon of button
+        """ set the icon of button, the icon is loaded when it is painted for the first time
 
         Parameters
         ----------
         iconPath: str
             the path of icon
         """
-        f = QFile(iconPath)
-        f.open(QFile.ReadOnly)
-        self._svgDom.setContent(f.readAll())
-        f.close()
+        self._iconPath = iconPath
+        self._icon = None
+        self._isIconShared = True
+        self._updateIconRefs()
+        self.update()
 
-    def paintEvent(self, e):
-        painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
-        color, bgColor = self._getColors()
+    def _loadIcon(self):
+        if self._icon is None and self._iconPath is not None:
+            # QtSvg, QtXml and the built-in resources are only loaded when the first icon is used
+            from .svg_icon import SvgIcon
+            self._icon = SvgIcon.fromFile(self._iconPath)
 
-        # draw background
-        painter.setBrush(bgColor)
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(self.rect())
+        return self._icon
+
+    @property
+    def _svgDom(self):
+        """ the svg document of icon
 
-        # draw icon
-        color = color.name()
-        pathNodes = self._svgDom.elementsByTagName('path')
-        for i in range(pathNodes.length()):
-            element = pathNodes.at(i).toElement()
-            element.setAttribute('stroke', color)
+        The icon is shared by all the buttons using the same icon path, so the
+        button makes a private copy of icon before the document is customized.
+        """
+        if self._isIconShared:
+            self._icon = self._loadIcon().copy()
+            self._isIconShared = False
+        else:
+            self._icon.invalidate()
+
+        self._updateIconRefs()
+        self.update()
+        return self._icon.document()
 
-        renderer = QSvgRenderer(self._svgDom.toByteArray())
-        renderer.render(painter, QRectF(self.rect()))
+    def _iconKey(self):
+        # the key of shared icon is its path, so the icon is not loaded to get the key
+        return self._iconPath if self._icon is None else self._icon.key
+
+    def _drawIcon(self, painter, color):
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+        self._loadIcon().render(painter, QRectF(self.rect()), color)
 
 
 class MinimizeButton(TitleBarButton):
     """ Minimize button """
 
-    def paintEvent(self, e):
-        painter = QPainter(self)
-        color, bgColor = self._getColors()
-
-        # draw background
-        painter.setBrush(bgColor)
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(self.rect())
+    def _iconKey(self):
+        return ("glyph", "minimize")
 
-        # draw icon
-        painter.setBrush(Qt.NoBrush)
+    def _drawIcon(self, painter, color):
         pen = QPen(color, 1)
         pen.setCosmetic(True)
         painter.setPen(pen)
@@ -262,16 +536,13 @@ class MaximizeButton(TitleBarButton):
         self._isMax = isMax
         self.setState(TitleBarButtonState.NORMAL)
 
-    def paintEvent(self, e):
-        painter = QPainter(self)
-        color, bgColor = self._getColors()
+    def _iconKey(self):
+        return ("glyph", "restore" if self._isMax else "maximize")
 
-        # draw background
-        painter.setBrush(bgColor)
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(self.rect())
+    def _iconKeys(self):
+        return (("glyph", "maximize"), ("glyph", "restore"))
 
-        # draw icon
+    def _drawIcon(self, painter, color):
         painter.setBrush(Qt.NoBrush)
         pen = QPen(color, 1)
         pen.setCosmetic(True)
@@ -297,9 +568,12 @@ class MaximizeButton(TitleBarButton):
 class CloseButton(SvgTitleBarButton):
     """ Close button """
 
+    defaultStyle = TitleBarButtonStyle(
+        hoverColor=QColor(Qt.white),
+        pressedColor=QColor(Qt.white),
+        hoverBackgroundColor=QColor(232, 17, 35),
+        pressedBackgroundColor=QColor(241, 112, 122)
+    )
+
     def __init__(self, parent=None):
         super().__init__(":/qframelesswindow/close.svg", parent)
-        self.setHoverColor(Qt.white)
-        self.setPressedColor(Qt.white)
-        self.setHoverBackgroundColor(QColor(232, 17, 35))
-        self.setPressedBackgroundColor(QColor(241, 112, 122))
@@ -1,12 +1,75 @@
 # coding:utf-8
+import os
 import sys
 
-if sys.platform == "win32":
-    from .win32_utils import WindowsMoveResize as MoveResize
-elif sys.platform == "darwin":
-    from .mac_utils import MacMoveResize as MoveResize
-else:
-    from .linux_utils import LinuxMoveResize as MoveResize
+from PyQt5.QtGui import QGuiApplication
+
+HEADLESS_PLATFORMS = {"offscreen", "minimal", "minimalegl"}
+
+_platformName = None
+_moveResize = None
+
+
+def platformName():
+    """ get the name of Qt platform plugin, such as `xcb`, `wayland` and `offscreen`
+
+    The name is cached once the application is created, before that it's
+    read from the `QT_QPA_PLATFORM` environment variable, and X11 is the default
+    on Linux like Qt 5.
+    """
+    global _platformName
+    if _platformName is not None:
+        return _platformName
+
+    if QGuiApplication.instance() is None:
+        name = os.environ.get("QT_QPA_PLATFORM", "").split(":")[0]
+        if not name and sys.platform not in ("win32", "darwin"):
+            name = "xcb"
+
+        return name
+
+    _platformName = QGuiApplication.platformName()
+    return _platformName
+
+
+def isPlatformX11():
+    """ whether the application is running on X11 """
+    return platformName() == "xcb"
+
+
+def _getMoveResize():
+    """ import the move resize backend of current platform on first use """
+    global _moveResize
+    if _moveResize is not None:
+        return _moveResize
+
+    # the platform may still change before the application is created
+    isCached = QGuiApplication.instance() is not None
+
+    name = platformName()
+    if name in HEADLESS_PLATFORMS:
+        from .offscreen_utils import OffscreenMoveResize as MoveResize
+    elif sys.platform == "win32":
+        from .win32_utils import WindowsMoveResize as MoveResize
+    elif sys.platform == "darwin":
+        from .mac_utils import MacMoveResize as MoveResize
+    elif name == "xcb":
+        from .linux_utils import LinuxMoveResize as MoveResize
+    else:
+        from .wayland_utils import WaylandMoveResize as MoveResize
+
+    if isCached:
+        _moveResize = MoveResize
+
+    return MoveResize
+
+
+def __getattr__(name):
+    """ keep `MoveResize` importable, the backend is imported on first access """
+    if name == "MoveResize":
+        return _getMoveResize()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def startSystemMove(window, globalPos):
@@ -20,7 +83,8 @@ def startSystemMove(window, globalPos):
     globalPos: QPoint
         the global point of mouse release event
     """
-    MoveResize.startSystemMove(window, globalPos)
+    _startLiveResize(window)
+    _getMoveResize().startSystemMove(window, globalPos)
 
 
 def starSystemResize(window, globalPos, edges):
@@ -37,4 +101,14 @@ def starSystemResize(window, globalPos, edges):
     edges: `Qt.Edges`
         window edges
     """
-    MoveResize.starSystemResize(window, globalPos, edges)
+    if edges:
+        _startLiveResize(window, True)
+
+    _getMoveResize().starSystemResize(window, globalPos, edges)
+
+
+def _startLiveResize(window, isResize=False):
+    """ notify the frameless window that it will be moved or resized by the system """
+    liveResize = getattr(window, "_liveResize", None)
+    if liveResize is not None:
+        liveResize.start(isResize=isResize)
@@ -0,0 +1,62 @@
+# coding:utf-8
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage
+
+
+def blurImage(image, radius, downsampleFactor=4, passes=3):
+    """ blur an image in software, the result is `downsampleFactor` times smaller than the image
+
+    The image is downsampled first, so the cost of blur is bounded by the
+    downsample factor. Three passes of box blur are close to a gaussian blur.
+    NumPy is required.
+
+    Parameters
+    ----------
+    image: QImage
+        the image to be blurred
+
+    radius: int
+        the radius of box blur in the pixels of `image`
+
+    downsampleFactor: int
+        the downsample factor of image
+
+    passes: int
+        the number of box blur passes
+
+    Returns
+    -------
+    blurredImage: QImage
+        blurred image with `Format_RGB32`
+    """
+    import numpy as np
+
+    size = image.size() / downsampleFactor
+    image = image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    image = image.convertToFormat(QImage.Format_RGB32)
+
+    w, h = image.width(), image.height()
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    pixels = np.frombuffer(bits, np.uint8).reshape(h, image.bytesPerLine())[:, :w*4].reshape(h, w, 4)
+
+    radius = max(1, round(radius / downsampleFactor))
+    rgb = pixels[..., :3].astype(np.uint32)
+    for _ in range(passes):
+        rgb = _boxBlur(rgb, radius)
+        rgb = _boxBlur(rgb.transpose(1, 0, 2), radius).transpose(1, 0, 2)
+
+    result = np.empty((h, w, 4), np.uint8)
+    result[..., :3] = rgb
+    result[..., 3] = 255
+    return QImage(result.data, w, h, w*4, QImage.Format_RGB32).copy()
+
+
+def _boxBlur(array, radius):
+    """ blur the rows of array with a box of `2 * radius + 1` pixels, the edges are extended """
+    import numpy as np
+
+    n = array.shape[0]
+    padded = np.concatenate([array[:1].repeat(radius + 1, 0), array, array[-1:].repeat(radius, 0)])
+    cumsum = padded.cumsum(0, dtype=np.uint32)
+    return (cumsum[2*radius+1:] - cumsum[:n]) // (2*radius + 1)
@@ -0,0 +1,140 @@
+# coding:utf-8
+from PyQt5.QtCore import Qt
+
+# the hit test codes are the same as the values of `Qt.Edge`
+NO_EDGE = 0
+TOP_EDGE = int(Qt.TopEdge)
+LEFT_EDGE = int(Qt.LeftEdge)
+RIGHT_EDGE = int(Qt.RightEdge)
+BOTTOM_EDGE = int(Qt.BottomEdge)
+
+
+class BorderHitTest:
+    """ Platform-neutral hit test of the resize border of frameless window
+
+    The result of hit test is a compact integer code, which is the bitwise
+    or of `TOP_EDGE`, `LEFT_EDGE`, `RIGHT_EDGE` and `BOTTOM_EDGE`, and can be
+    converted to `Qt.Edges` directly.
+    """
+
+    def __init__(self, borderWidth=5, cornerSize=None):
+        """
+        Parameters
+        ----------
+        borderWidth: int
+            the width of all resize borders in device independent pixels
+
+        cornerSize: int
+            the size of corner grab zone, use the largest border width if it's `None`
+        """
+        self._cornerSize = cornerSize
+        self.setBorderWidths(borderWidth, borderWidth, borderWidth, borderWidth)
+
+    def setBorderWidths(self, left, top, right, bottom):
+        """ set the width of each resize border in device independent pixels """
+        self.left = left
+        self.top = top
+        self.right = right
+        self.bottom = bottom
+        self.setCornerSize(self._cornerSize)
+
+    def setCornerSize(self, size):
+        """ set the size of corner grab zone in device independent pixels
+
+        Parameters
+        ----------
+        size: int
+            corner size, use the largest border width if it's `None`
+        """
+        self._cornerSize = size
+        self.corner = max(self.left, self.top, self.right, self.bottom) if size is None else size
+
+    def hitTest(self, x, y, width, height, dpr=1.0, isMaximized=False):
+        """ classify a point of window
+
+        Parameters
+        ----------
+        x, y: int
+            the position relative to the top left corner of window
+
+        width, height: int
+            the size of window
+
+        dpr: float
+            the device pixel ratio of coordinates, the border widths will be scaled by it
+
+        isMaximized: bool
+            whether the window is maximized or full screen, there is no resize border if it's `True`
+
+        Returns
+        -------
+        code: int
+            hit test code, `NO_EDGE` if the point is not on the border
+        """
+        if isMaximized:
+            return NO_EDGE
+
+        left = x < self.left * dpr
+        right = not left and x >= width - self.right * dpr
+        top = y < self.top * dpr
+        bottom = not top and y >= height - self.bottom * dpr
+
+        # enlarge the grab zone of corners
+        corner = self.corner * dpr
+        if top or bottom:
+            left = left or x < corner
+            right = not left and (right or x >= width - corner)
+        if left or right:
+            top = top or y < corner
+            bottom = not top and (bottom or y >= height - corner)
+
+        return TOP_EDGE*top | LEFT_EDGE*left | RIGHT_EDGE*right | BOTTOM_EDGE*bottom
+
+    def hitTestBatch(self, xs, ys, width, height, dpr=1.0, isMaximized=False):
+        """ classify a batch of points, such as a recorded pointer trace
+
+        Parameters
+        ----------
+        xs, ys: array_like
+            the positions relative to the top left corner of window
+
+        width, height: int
+            the size of window
+
+        dpr: float
+            the device pixel ratio of coordinates, the border widths will be scaled by it
+
+        isMaximized: bool
+            whether the window is maximized or full screen, there is no resize border if it's `True`
+
+        Returns
+        -------
+        codes: `numpy.ndarray`
+            hit test codes with dtype `uint8`
+        """
+        import numpy as np
+
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        if isMaximized:
+            return np.zeros(np.broadcast(xs, ys).shape, np.uint8)
+
+        left = xs < self.left * dpr
+        right = ~left & (xs >= width - self.right * dpr)
+        top = ys < self.top * dpr
+        bottom = ~top & (ys >= height - self.bottom * dpr)
+
+        # enlarge the grab zone of corners
+        corner = self.corner * dpr
+        horizontal = top | bottom
+        left |= horizontal & (xs < corner)
+        right = ~left & (right | horizontal & (xs >= width - corner))
+        vertical = left | right
+        top |= vertical & (ys < corner)
+        bottom = ~top & (bottom | vertical & (ys >= height - corner))
+
+        codes = top * np.uint8(TOP_EDGE)
+        codes |= left * np.uint8(LEFT_EDGE)
+        codes |= right * np.uint8(RIGHT_EDGE)
+        codes |= bottom * np.uint8(BOTTOM_EDGE)
+        return codes
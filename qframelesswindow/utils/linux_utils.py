@@ -1,16 +1,43 @@
 # coding: utf-8
 from enum import Enum
+from io import BytesIO
+from struct import pack, pack_into
 
 import xcffib as xcb
 from PyQt5 import sip
-from PyQt5.QtCore import QPointF, Qt, QEvent, QPoint
-from PyQt5.QtGui import QMouseEvent
-from PyQt5.QtWidgets import QWidget, QApplication
+from PyQt5.QtCore import QPointF, Qt
 from PyQt5.QtX11Extras import QX11Info
-from xcffib.xproto import (ButtonIndex, ButtonMask, ButtonReleaseEvent,
-                           ClientMessageData, ClientMessageEvent, EventMask,
+from xcffib.xproto import (Atom, ButtonIndex, ButtonMask, EventMask, PropMode,
                            xprotoExtension)
 
+# opcodes of core requests and codes of core events
+CHANGE_PROPERTY = 18
+DELETE_PROPERTY = 19
+SEND_EVENT = 25
+UNGRAB_POINTER = 27
+BUTTON_RELEASE = 5
+CLIENT_MESSAGE = 33
+
+# refer to: https://www.x.org/releases/X11R7.7/doc/xproto/x11protocol.html#Encoding::Requests
+UNGRAB_POINTER_REQUEST = pack("=xx2xI", xcb.CurrentTime)
+
+# SendEvent(propagate=True, destination=window, ButtonRelease, ButtonReleaseEvent),
+# the window is patched at offset 4, the root, event and child windows and the
+# root and event coordinates are patched at offset 20
+BUTTON_RELEASE_REQUEST = bytearray(
+    pack("=xB2xII", True, 0, EventMask.ButtonRelease) +
+    pack("=BBHIIIIhhhhHBx", BUTTON_RELEASE, ButtonIndex._1, 0,
+         xcb.CurrentTime, 0, 0, xcb.NONE, 0, 0, 0, 0, ButtonMask._1, True)
+)
+
+# SendEvent(propagate=False, destination=root, SubstructureRedirect | SubstructureNotify, ClientMessageEvent),
+# the root window is patched at offset 4, the window, message type and the
+# first three data items are patched at offset 16
+MOVE_RESIZE_REQUEST = bytearray(
+    pack("=xB2xII", False, 0, EventMask.SubstructureRedirect | EventMask.SubstructureNotify) +
+    pack("=BBHII5I", CLIENT_MESSAGE, 32, 0, 0, 0, 0, 0, 0, ButtonIndex._1, 0)
+)
+
 
 class WindowMessage(Enum):
     """ Window message enum class """
@@ -29,10 +56,177 @@ class WindowMessage(Enum):
     _NET_WM_MOVERESIZE_CANCEL = 11
 
 
+class XcbConnection:
+    """ Connection to the X server shared by all the windows of a display
+
+    The connection of Qt is wrapped only once, and all the atoms used by
+    qframelesswindow are interned with pipelined requests on first use, so
+    they are resolved in a single round trip.
+    """
+
+    ATOMS = (
+        "WM_PROTOCOLS",
+        "_NET_SUPPORTED",
+        "_NET_WM_MOVERESIZE",
+        "_NET_WM_OPAQUE_REGION",
+        "_NET_WM_BYPASS_COMPOSITOR",
+        "_NET_WM_SYNC_REQUEST",
+        "_NET_WM_SYNC_REQUEST_COUNTER",
+        "_GTK_FRAME_EXTENTS",
+        "_KDE_NET_WM_BLUR_BEHIND_REGION",
+    )
+
+    _connections = {}
+
+    def __init__(self, pointer):
+        """
+        Parameters
+        ----------
+        pointer: int
+            the address of `xcb_connection_t` created by Qt
+        """
+        self.connection = xcb.wrap(pointer)
+        self.xproto = xprotoExtension(self.connection)
+        self._atoms = {}
+        self._rootWindows = {}
+        self._supportedAtoms = None
+
+    @classmethod
+    def instance(cls):
+        """ get the connection of current application """
+        pointer = sip.unwrapinstance(QX11Info.connection())
+        conn = cls._connections.get(pointer)
+        if conn is None:
+            conn = cls._connections[pointer] = cls(pointer)
+
+        return conn
+
+    def rootWindow(self, screen=-1):
+        """ get the root window of screen, the root window of default screen is returned if `screen` is -1 """
+        root = self._rootWindows.get(screen)
+        if root is None:
+            root = self._rootWindows[screen] = QX11Info.appRootWindow(screen)
+
+        return root
+
+    def atom(self, name):
+        """ get the atom of name
+
+        Parameters
+        ----------
+        name: str
+            the name of atom, the atoms in `ATOMS` are interned together on first use
+        """
+        atom = self._atoms.get(name)
+        if atom is None:
+            self.internAtoms(self.ATOMS + (name,) if not self._atoms else (name,))
+            atom = self._atoms[name]
+
+        return atom
+
+    def internAtoms(self, names):
+        """ intern atoms, all the requests are sent before waiting for the first reply
+
+        Parameters
+        ----------
+        names: Iterable[str]
+            the names of atoms
+        """
+        names = [i for i in dict.fromkeys(names) if i not in self._atoms]
+        cookies = [self.xproto.InternAtom(False, len(i), i) for i in names]
+        for name, cookie in zip(names, cookies):
+            self._atoms[name] = cookie.reply().atom
+
+    def isSupported(self, name):
+        """ whether the window manager lists the atom in `_NET_SUPPORTED`
+
+        Parameters
+        ----------
+        name: str
+            the name of atom, such as `_KDE_NET_WM_BLUR_BEHIND_REGION`
+        """
+        if self._supportedAtoms is None:
+            self._supportedAtoms = set(self.getProperty(self.rootWindow(), "_NET_SUPPORTED", Atom.ATOM))
+
+        return self.atom(name) in self._supportedAtoms
+
+    def getProperty(self, window, name, type=Atom.CARDINAL):
+        """ get a property of window whose format is 32, this method waits for the reply
+
+        Parameters
+        ----------
+        window: int
+            window id
+
+        name: str
+            the name of property
+
+        type: int
+            the type of property, such as `Atom.CARDINAL` and `Atom.ATOM`
+
+        Returns
+        -------
+        values: Tuple[int]
+            the values of property, it's empty if the property doesn't exist
+        """
+        reply = self.xproto.GetProperty(False, window, self.atom(name), type, 0, 2**16).reply()
+        return reply.value.to_atoms() if reply.format == 32 else ()
+
+    def setCardinalProperty(self, window, name, values):
+        """ replace a property of window with a list of 32-bit cardinals
+
+        Parameters
+        ----------
+        window: int
+            window id
+
+        name: str
+            the name of property
+
+        values: Sequence[int]
+            the values of property
+        """
+        request = pack(f"=xB2xIIIB3xI{len(values)}I", PropMode.Replace, window,
+                       self.atom(name), Atom.CARDINAL, 32, len(values), *values)
+        self.sendRequest(CHANGE_PROPERTY, request)
+
+    def deleteProperty(self, window, name):
+        """ delete a property of window
+
+        Parameters
+        ----------
+        window: int
+            window id
+
+        name: str
+            the name of property
+        """
+        self.sendRequest(DELETE_PROPERTY, pack("=xx2xII", window, self.atom(name)))
+
+    def sendRequest(self, opcode, data):
+        """ send a core request without waiting for reply
+
+        Parameters
+        ----------
+        opcode: int
+            the major opcode of request
+
+        data: bytes | bytearray
+            the packed request, the opcode and length fields are filled by xcb
+        """
+        self.xproto.send_request(opcode, BytesIO(data))
+
+    def flush(self):
+        """ flush the pending requests """
+        self.connection.flush()
+
+
 class LinuxMoveResize:
     """ Tool class for moving and resizing window """
 
-    moveResizeAtom = None
+    # the requests are packed once, and only the windows, atom and coordinates are patched
+    _buttonReleaseRequest = BUTTON_RELEASE_REQUEST
+    _moveResizeRequest = MOVE_RESIZE_REQUEST
 
     @classmethod
     def sendButtonReleaseEvent(cls, window, globalPos):
@@ -46,30 +240,10 @@ class LinuxMoveResize:
         globalPos: QPoint
             the global point of mouse release event
         """
+        conn = XcbConnection.instance()
         globalPos = QPointF(QPointF(globalPos) *
                             window.devicePixelRatio()).toPoint()
-        pos = window.mapFromGlobal(globalPos)
-
-        # open the connection to X server
-        conn = xcb.wrap(sip.unwrapinstance(QX11Info.connection()))
-        windowId = int(window.winId())
-        xproto = xprotoExtension(conn)
-
-        # refer to: https://www.x.org/releases/X11R7.5/doc/libxcb/tutorial/
-        event = ButtonReleaseEvent.synthetic(
-            detail=ButtonIndex._1,
-            time=xcb.CurrentTime,
-            root=QX11Info.appRootWindow(QX11Info.appScreen()),
-            event=windowId,
-            child=xcb.NONE,
-            root_x=globalPos.x(),
-            root_y=globalPos.y(),
-            event_x=pos.x(),
-            event_y=pos.y(),
-            state=ButtonMask._1,
-            same_screen=True,
-        )
-        xproto.SendEvent(True, windowId, EventMask.ButtonRelease, event.pack())
+        cls._sendButtonRelease(conn, window, int(window.winId()), globalPos)
         conn.flush()
 
     @classmethod
@@ -87,52 +261,46 @@ class LinuxMoveResize:
         message: int
             window message
         """
-        cls.sendButtonReleaseEvent(window, globalPos)
-
+        conn = XcbConnection.instance()
+        windowId = int(window.winId())
         globalPos = QPointF(QPointF(globalPos) *
                             window.devicePixelRatio()).toPoint()
 
-        # open the connection to X server
-        conn = xcb.wrap(sip.unwrapinstance(QX11Info.connection()))
-        xproto = xprotoExtension(conn)
-
-        if not cls.moveResizeAtom:
-            cls.moveResizeAtom = xproto.InternAtom(
-                False, len("_NET_WM_MOVERESIZE"), "_NET_WM_MOVERESIZE").reply().atom
-
-        union = ClientMessageData.synthetic([
-            globalPos.x(),
-            globalPos.y(),
-            message,
-            ButtonIndex._1,
-            0
-        ], "I"*5)
-        event = ClientMessageEvent.synthetic(
-            format=32,
-            window=int(window.winId()),
-            type=cls.moveResizeAtom,
-            data=union
-        )
-        xproto.UngrabPointer(xcb.CurrentTime)
-        xproto.SendEvent(
-            False,
-            QX11Info.appRootWindow(QX11Info.appScreen()),
-            EventMask.SubstructureRedirect | EventMask.SubstructureNotify,
-            event.pack()
-        )
+        cls._sendButtonRelease(conn, window, windowId, globalPos)
+        conn.sendRequest(UNGRAB_POINTER, UNGRAB_POINTER_REQUEST)
+
+        request = cls._moveResizeRequest
+        pack_into("=I", request, 4, conn.rootWindow())
+        pack_into("=IIiiI", request, 16, windowId, conn.atom("_NET_WM_MOVERESIZE"),
+                  globalPos.x(), globalPos.y(), message)
+        conn.sendRequest(SEND_EVENT, request)
+
+        # all the requests are sent in one flush without waiting for any reply
         conn.flush()
 
+    @classmethod
+    def _sendButtonRelease(cls, conn, window, windowId, globalPos):
+        pos = window.mapFromGlobal(globalPos)
+        request = cls._buttonReleaseRequest
+        pack_into("=I", request, 4, windowId)
+        pack_into("=IIIhhhh", request, 20, conn.rootWindow(), windowId, xcb.NONE,
+                  globalPos.x(), globalPos.y(), pos.x(), pos.y())
+        conn.sendRequest(SEND_EVENT, request)
+
+    @classmethod
+    def isMouseButtonPressed(cls):
+        """ whether the left mouse button is held """
+        # the window manager grabs the pointer while moving or resizing the window,
+        # so the state of button is queried from the X server
+        conn = XcbConnection.instance()
+        reply = conn.xproto.QueryPointer(conn.rootWindow()).reply()
+        return bool(reply.mask & ButtonMask._1)
+
     @classmethod
     def startSystemMove(cls, window, globalPos):
         """ move window """
-        if QX11Info.isPlatformX11():
-            cls.startSystemMoveResize(
-                window, globalPos, WindowMessage._NET_WM_MOVERESIZE_MOVE.value)
-        else:
-            window.windowHandle().startSystemMove()
-            event = QMouseEvent(QEvent.MouseButtonRelease, QPoint(-1, -1),
-                                Qt.LeftButton, Qt.NoButton, Qt.NoModifier)
-            QApplication.instance().postEvent(window.windowHandle(), event)
+        cls.startSystemMoveResize(
+            window, globalPos, WindowMessage._NET_WM_MOVERESIZE_MOVE.value)
 
     @classmethod
     def starSystemResize(cls, window, globalPos, edges):
@@ -152,17 +320,14 @@ class LinuxMoveResize:
         if not edges:
             return
 
-        if QX11Info.isPlatformX11():
-            messageMap = {
-                Qt.TopEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_TOP,
-                Qt.TopEdge | Qt.LeftEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_TOPLEFT,
-                Qt.TopEdge | Qt.RightEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_TOPRIGHT,
-                Qt.BottomEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_BOTTOM,
-                Qt.BottomEdge | Qt.LeftEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_BOTTOMLEFT,
-                Qt.BottomEdge | Qt.RightEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_BOTTOMRIGHT,
-                Qt.LeftEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_LEFT,
-                Qt.RightEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_RIGHT,
-            }
-            cls.startSystemMoveResize(window, globalPos, messageMap[edges].value)
-        else:
-            window.windowHandle().startSystemResize(edges)
+        messageMap = {
+            Qt.TopEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_TOP,
+            Qt.TopEdge | Qt.LeftEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_TOPLEFT,
+            Qt.TopEdge | Qt.RightEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_TOPRIGHT,
+            Qt.BottomEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_BOTTOM,
+            Qt.BottomEdge | Qt.LeftEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_BOTTOMLEFT,
+            Qt.BottomEdge | Qt.RightEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_BOTTOMRIGHT,
+            Qt.LeftEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_LEFT,
+            Qt.RightEdge: WindowMessage._NET_WM_MOVERESIZE_SIZE_RIGHT,
+        }
+        cls.startSystemMoveResize(window, globalPos, messageMap[edges].value)
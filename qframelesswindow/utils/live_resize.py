@@ -0,0 +1,281 @@
+# coding:utf-8
+from PyQt5.QtCore import QElapsedTimer, QObject, QRect, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QWidget
+
+
+class ResizeSnapshot(QWidget):
+    """ Overlay which shows a snapshot of window content during live resize """
+
+    def __init__(self, pixmap, isStretched=True, parent=None):
+        """
+        Parameters
+        ----------
+        pixmap: QPixmap
+            the snapshot of window content
+
+        isStretched: bool
+            whether to stretch the snapshot to the size of overlay, otherwise the
+            snapshot is drawn at the top left corner and the rest is padded with
+            the window color
+
+        parent: QWidget
+            parent widget
+        """
+        super().__init__(parent=parent)
+        self.pixmap = pixmap
+        self.isStretched = isStretched
+
+        # the widgets covered by the opaque overlay are not repainted
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+
+    def paintEvent(self, e):
+        painter = QPainter(self)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        if self.isStretched:
+            painter.drawPixmap(self.rect(), self.pixmap)
+            return
+
+        size = self.pixmap.size() / self.pixmap.devicePixelRatio()
+        painter.drawPixmap(0, 0, self.pixmap)
+
+        color = self.parentWidget().palette().window()
+        painter.fillRect(size.width(), 0, self.width() - size.width(), self.height(), color)
+        painter.fillRect(0, size.height(), size.width(), self.height() - size.height(), color)
+
+
+class LiveResizeTracker(QObject):
+    """ Track the interactive move or resize of a frameless window
+
+    While the window is moved or resized, its layout is disabled, and the
+    layout and the geometry of title bar are updated at most once per frame.
+    The `started` and `finished` signals are owned by the tracker, so the window
+    may be built by multiple inheritance without declaring any signal.
+
+    If snapshot is enabled, the content below the title bar is grabbed once when
+    the resize starts and shown by an overlay instead of being laid out, only
+    the title bar is updated until the resize finishes.
+    """
+
+    started = pyqtSignal()
+    finished = pyqtSignal()
+
+    FRAME_INTERVAL = 16
+
+    # the delay after the last move or resize event to finish the live resize
+    # if the platform doesn't report the end of it, the live resize goes on
+    # while the mouse button is held, so pausing in the middle of dragging
+    # doesn't finish it
+    FINISH_DELAY = 300
+
+    # if the state of mouse button is unknown, a move or resize event received
+    # within this delay after the automatic finish restarts the live resize, so
+    # the snapshot is shown again after pausing in the middle of dragging
+    RESTART_DELAY = 2000
+
+    def __init__(self, window, updateGeometry):
+        """
+        Parameters
+        ----------
+        window: QWidget
+            frameless window
+
+        updateGeometry: Callable[[], None]
+            the function which updates the geometry of title bar
+        """
+        super().__init__(window)
+        self.window = window
+        self.updateGeometry = updateGeometry
+        self._isActive = False
+        self._isAutoFinish = True
+        self._isResize = False
+        self._layout = None
+        self._restartIsResize = None
+        self._autoFinishClock = QElapsedTimer()
+        self._isSnapshotEnabled = False
+        self._isSnapshotStretched = True
+        self._snapshot = None
+
+        self._frameTimer = QTimer(self)
+        self._frameTimer.setSingleShot(True)
+        self._frameTimer.setTimerType(Qt.PreciseTimer)
+        self._frameTimer.setInterval(self.FRAME_INTERVAL)
+        self._frameTimer.timeout.connect(self._updateLayout)
+
+        self._finishTimer = QTimer(self)
+        self._finishTimer.setSingleShot(True)
+        self._finishTimer.setInterval(self.FINISH_DELAY)
+        self._finishTimer.timeout.connect(self._onFinishTimeout)
+
+    def isActive(self):
+        """ whether the window is moved or resized interactively """
+        return self._isActive
+
+    def isSnapshotEnabled(self):
+        """ whether to show the snapshot of content during live resize """
+        return self._isSnapshotEnabled
+
+    def setSnapshotEnabled(self, isEnabled, isStretched=True):
+        """ set whether to show the snapshot of content during live resize
+
+        Parameters
+        ----------
+        isEnabled: bool
+            whether to enable snapshot
+
+        isStretched: bool
+            whether to stretch the snapshot to the size of content, otherwise the
+            snapshot is padded with the window color
+        """
+        self._isSnapshotEnabled = isEnabled
+        self._isSnapshotStretched = isStretched
+        if not isEnabled and self._snapshot is not None:
+            self._removeSnapshot()
+            self._updateLayout()
+
+    def start(self, isAutoFinish=True, isResize=False):
+        """ start live resize
+
+        Parameters
+        ----------
+        isAutoFinish: bool
+            whether to finish the live resize when no move or resize event is received
+            for `FINISH_DELAY` milliseconds, it should be `False` if `finish()` will be
+            called when the platform reports the end of live resize
+
+        isResize: bool
+            whether the window is resized, the snapshot is only shown when resizing
+        """
+        if not self._isActive:
+            self._isAutoFinish = isAutoFinish
+        elif not isAutoFinish:
+            self._isAutoFinish = False
+
+        if self._isAutoFinish:
+            self._finishTimer.start()
+        else:
+            self._finishTimer.stop()
+
+        if isResize and self._isSnapshotEnabled and self._snapshot is None:
+            self._showSnapshot()
+
+        if self._isActive:
+            self._isResize = self._isResize or isResize
+            return
+
+        self._isActive = True
+        self._isResize = isResize
+        self._restartIsResize = None
+        layout = self.window.layout()
+        if layout is not None and layout.isEnabled():
+            self._layout = layout
+            layout.setEnabled(False)
+
+        self.started.emit()
+
+    def finish(self):
+        """ finish live resize, the layout is updated immediately """
+        self._restartIsResize = None
+        if not self._isActive:
+            return
+
+        self._isActive = False
+        self._frameTimer.stop()
+        self._finishTimer.stop()
+        self._removeSnapshot()
+        self._updateLayout()
+        self._layout = None
+        self.finished.emit()
+
+    def requestUpdate(self):
+        """ request to update the layout after the window is resized
+
+        Returns
+        -------
+        isDeferred: bool
+            `True` if the update is deferred to the next frame, otherwise the caller
+            should update the geometry immediately
+        """
+        if not self._isActive and not self._restart():
+            return False
+
+        if self._isAutoFinish:
+            self._finishTimer.start()
+
+        if not self._frameTimer.isActive():
+            self._frameTimer.start()
+
+        return True
+
+    def notifyMoved(self):
+        """ postpone the automatic finish after the window is moved """
+        if not self._isActive:
+            self._restart()
+        elif self._isAutoFinish:
+            self._finishTimer.start()
+
+    def _onFinishTimeout(self):
+        from . import _getMoveResize
+
+        isPressed = _getMoveResize().isMouseButtonPressed()
+        if isPressed:
+            return self._finishTimer.start()
+
+        isResize = self._isResize
+        self.finish()
+
+        # the dragging may be paused rather than finished
+        if isPressed is None:
+            self._restartIsResize = isResize
+            self._autoFinishClock.start()
+
+    def _restart(self):
+        """ restart the live resize which is finished automatically in the middle of dragging """
+        isResize = self._restartIsResize
+        if isResize is None or self._autoFinishClock.elapsed() > self.RESTART_DELAY:
+            self._restartIsResize = None
+            return False
+
+        self.start(isResize=isResize)
+        return True
+
+    def _showSnapshot(self):
+        rect = self._snapshotRect()
+        if rect.isEmpty():
+            return
+
+        self._snapshot = ResizeSnapshot(self.window.grab(rect), self._isSnapshotStretched, self.window)
+        self._snapshot.setGeometry(rect)
+        self._snapshot.show()
+        self.window.titleBar.raise_()
+
+    def _removeSnapshot(self):
+        if self._snapshot is None:
+            return
+
+        self._snapshot.hide()
+        self._snapshot.deleteLater()
+        self._snapshot = None
+
+    def _snapshotRect(self):
+        """ get the rect of content below the title bar """
+        titleBar = self.window.titleBar
+        margin = titleBar.x()
+        top = titleBar.y() + titleBar.height()
+        return QRect(margin, top, self.window.width() - 2*margin, self.window.height() - top - margin)
+
+    def _updateLayout(self):
+        self.updateGeometry()
+        if self._snapshot is not None:
+            self._snapshot.setGeometry(self._snapshotRect())
+            return
+
+        layout = self._layout
+        if layout is None or layout is not self.window.layout():
+            return
+
+        layout.setEnabled(True)
+        layout.invalidate()
+        layout.activate()
+        layout.setEnabled(not self._isActive)
@@ -14,6 +14,11 @@ QT_VERSION = tuple(int(v) for v in QT_VERSION_STR.split('.'))
 class MacMoveResize:
     """ Tool class for moving and resizing Mac OS window """
 
+    @staticmethod
+    def isMouseButtonPressed():
+        """ whether the left mouse button is held """
+        return bool(Cocoa.NSEvent.pressedMouseButtons() & 1)
+
     @staticmethod
     def startSystemMove(window: QWidget, globalPos):
         """ resize window
@@ -0,0 +1,45 @@
+# coding: utf-8
+
+
+class OffscreenMoveResize:
+    """ Tool class for moving and resizing window on headless platforms, such as `offscreen` and `minimal`
+
+    There is no window manager on these platforms, so the system move and
+    resize requests are ignored.
+    """
+
+    @staticmethod
+    def isMouseButtonPressed():
+        """ whether the left mouse button is held """
+        return False
+
+    @staticmethod
+    def startSystemMove(window, globalPos):
+        """ move window
+
+        Parameters
+        ----------
+        window: QWidget
+            window
+
+        globalPos: QPoint
+            the global point of mouse release event
+        """
+        pass
+
+    @staticmethod
+    def starSystemResize(window, globalPos, edges):
+        """ resize window
+
+        Parameters
+        ----------
+        window: QWidget
+            window
+
+        globalPos: QPoint
+            the global point of mouse release event
+
+        edges: `Qt.Edges`
+            window edges
+        """
+        pass
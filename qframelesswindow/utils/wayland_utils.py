@@ -0,0 +1,53 @@
+# coding: utf-8
+from PyQt5.QtCore import QEvent, QPoint, Qt
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QApplication
+
+
+class WaylandMoveResize:
+    """ Tool class for moving and resizing window on Wayland and other platforms supported by `QWindow` """
+
+    @staticmethod
+    def isMouseButtonPressed():
+        """ whether the left mouse button is held, `None` means the state is unknown """
+        # the compositor grabs the pointer, so the release of button is never received
+        return None
+
+    @staticmethod
+    def startSystemMove(window, globalPos):
+        """ move window
+
+        Parameters
+        ----------
+        window: QWidget
+            window
+
+        globalPos: QPoint
+            the global point of mouse release event
+        """
+        window.windowHandle().startSystemMove()
+
+        # the compositor grabs the pointer, so the release event will never be received
+        event = QMouseEvent(QEvent.MouseButtonRelease, QPoint(-1, -1),
+                            Qt.LeftButton, Qt.NoButton, Qt.NoModifier)
+        QApplication.instance().postEvent(window.windowHandle(), event)
+
+    @staticmethod
+    def starSystemResize(window, globalPos, edges):
+        """ resize window
+
+        Parameters
+        ----------
+        window: QWidget
+            window
+
+        globalPos: QPoint
+            the global point of mouse release event
+
+        edges: `Qt.Edges`
+            window edges
+        """
+        if not edges:
+            return
+
+        window.windowHandle().startSystemResize(edges)
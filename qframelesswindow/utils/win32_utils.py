@@ -290,6 +290,11 @@ class Taskbar:
 class WindowsMoveResize:
     """ Tool class for moving and resizing Mac OS window """
 
+    @staticmethod
+    def isMouseButtonPressed():
+        """ whether the left mouse button is held """
+        return win32api.GetKeyState(win32con.VK_LBUTTON) < 0
+
     @staticmethod
     def startSystemMove(window, globalPos):
         """ resize window
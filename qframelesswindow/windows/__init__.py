@@ -12,10 +12,24 @@ from PyQt5.QtWidgets import QApplication, QWidget
 
 from ..titlebar import TitleBar
 from ..utils import win32_utils as win_utils
+from ..utils.hit_test import (BOTTOM_EDGE, LEFT_EDGE, RIGHT_EDGE, TOP_EDGE,
+                              BorderHitTest)
+from ..utils.live_resize import LiveResizeTracker
 from ..utils.win32_utils import Taskbar
 from .c_structures import LPNCCALCSIZE_PARAMS
 from .window_effect import WindowsWindowEffect
 
+HIT_TEST_RESULTS = {
+    TOP_EDGE | LEFT_EDGE: win32con.HTTOPLEFT,
+    BOTTOM_EDGE | RIGHT_EDGE: win32con.HTBOTTOMRIGHT,
+    TOP_EDGE | RIGHT_EDGE: win32con.HTTOPRIGHT,
+    BOTTOM_EDGE | LEFT_EDGE: win32con.HTBOTTOMLEFT,
+    TOP_EDGE: win32con.HTTOP,
+    BOTTOM_EDGE: win32con.HTBOTTOM,
+    LEFT_EDGE: win32con.HTLEFT,
+    RIGHT_EDGE: win32con.HTRIGHT,
+}
+
 
 class WindowsFramelessWindow(QWidget):
     """  Frameless window for Windows system """
@@ -27,6 +41,8 @@ class WindowsFramelessWindow(QWidget):
         self.windowEffect = WindowsWindowEffect(self)
         self.titleBar = TitleBar(self)
         self._isResizeEnabled = True
+        self._borderHitTest = BorderHitTest(self.BORDER_WIDTH)
+        self._liveResize = LiveResizeTracker(self, self._updateTitleBarGeometry)
 
         self.updateFrameless()
 
@@ -68,8 +84,44 @@ class WindowsFramelessWindow(QWidget):
         """ set whether resizing is enabled """
         self._isResizeEnabled = isEnabled
 
+    @property
+    def liveResizeStarted(self):
+        """ signal emitted when the window starts to be moved or resized interactively """
+        return self._liveResize.started
+
+    @property
+    def liveResizeFinished(self):
+        """ signal emitted when the interactive move or resize of window finishes """
+        return self._liveResize.finished
+
+    def isLiveResizing(self):
+        """ whether the window is moved or resized interactively """
+        return self._liveResize.isActive()
+
+    def setSnapshotResizeEnabled(self, isEnabled: bool, isStretched=True):
+        """ set whether to show a snapshot of content instead of laying it out during live resize
+
+        Parameters
+        ----------
+        isEnabled: bool
+            whether to enable snapshot resizing
+
+        isStretched: bool
+            whether to stretch the snapshot to the size of window, otherwise the
+            snapshot is padded with the window color
+        """
+        self._liveResize.setSnapshotEnabled(isEnabled, isStretched)
+
+    def isSnapshotResizeEnabled(self):
+        """ whether snapshot resizing is enabled """
+        return self._liveResize.isSnapshotEnabled()
+
     def resizeEvent(self, e):
         super().resizeEvent(e)
+        if not self._liveResize.requestUpdate():
+            self._updateTitleBarGeometry()
+
+    def _updateTitleBarGeometry(self):
         self.titleBar.resize(self.width(), self.titleBar.height())
 
     def nativeEvent(self, eventType, message):
@@ -80,33 +132,14 @@ class WindowsFramelessWindow(QWidget):
 
         if msg.message == win32con.WM_NCHITTEST and self._isResizeEnabled:
             pos = QCursor.pos()
-            xPos = pos.x() - self.x()
-            yPos = pos.y() - self.y()
             w = self.frameGeometry().width()
             h = self.frameGeometry().height()
 
             # fixes issue https://github.com/zhiyiYo/PyQt-Frameless-Window/issues/98
-            bw = 0 if win_utils.isMaximized(msg.hWnd) or win_utils.isFullScreen(msg.hWnd) else self.BORDER_WIDTH
-            lx = xPos < bw
-            rx = xPos > w - bw
-            ty = yPos < bw
-            by = yPos > h - bw
-            if lx and ty:
-                return True, win32con.HTTOPLEFT
-            elif rx and by:
-                return True, win32con.HTBOTTOMRIGHT
-            elif rx and ty:
-                return True, win32con.HTTOPRIGHT
-            elif lx and by:
-                return True, win32con.HTBOTTOMLEFT
-            elif ty:
-                return True, win32con.HTTOP
-            elif by:
-                return True, win32con.HTBOTTOM
-            elif lx:
-                return True, win32con.HTLEFT
-            elif rx:
-                return True, win32con.HTRIGHT
+            isMax = win_utils.isMaximized(msg.hWnd) or win_utils.isFullScreen(msg.hWnd)
+            edges = self._borderHitTest.hitTest(pos.x() - self.x(), pos.y() - self.y(), w, h, isMaximized=isMax)
+            if edges:
+                return True, HIT_TEST_RESULTS[edges]
         elif msg.message == win32con.WM_NCCALCSIZE:
             if msg.wParam:
                 rect = cast(msg.lParam, LPNCCALCSIZE_PARAMS).contents.rgrc[0]
@@ -140,6 +173,12 @@ class WindowsFramelessWindow(QWidget):
 
             result = 0 if not msg.wParam else win32con.WVR_REDRAW
             return True, result
+        elif msg.message == win32con.WM_ENTERSIZEMOVE:
+            self._liveResize.start(False)
+        elif msg.message == win32con.WM_SIZING:
+            self._liveResize.start(False, True)
+        elif msg.message == win32con.WM_EXITSIZEMOVE:
+            self._liveResize.finish()
 
         return super().nativeEvent(eventType, message)
 